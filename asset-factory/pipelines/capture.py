@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -28,6 +29,9 @@ def _load_dotenv() -> None:
 
 _load_dotenv()
 
+CAPTURE_VIEWPORT = {"width": 1440, "height": 900}
+
+
 def _normalize_url(url: str) -> str:
     url = url.strip()
     if not url.startswith("http"):
@@ -409,10 +413,33 @@ def _extract_section_payloads(page) -> list[dict]:
               .sort((a, b) => b[1] - a[1])
               .slice(0, limit)
               .map(([value, count]) => ({ value, count }));
-          const collectComputed = (root) => {
+          const ATOM_NODES = 60;
+          // Both computed_styles and atoms read the same visible nodes, so
+          // measure them once per section: every rect first, then every
+          // style, without interleaving layout and style reads per node.
+          const measureNodes = (root) => {
             const nodes = Array.from(
               root.querySelectorAll('h1, h2, h3, p, li, a, button, img, video, input, textarea, select')
             );
+            const visible = [];
+            for (const node of nodes) {
+              if (visible.length >= MAX_STYLE_NODES) break;
+              const rect = node.getBoundingClientRect();
+              if (rect.width < 8 || rect.height < 8) continue;
+              visible.push({ node, rect });
+            }
+            for (const item of visible) {
+              item.styles = stylePick(getComputedStyle(item.node));
+            }
+            return visible;
+          };
+          const bboxOf = (rect) => ({
+            x: Math.round(rect.x),
+            y: Math.round(rect.y + window.scrollY),
+            w: Math.round(rect.width),
+            h: Math.round(rect.height),
+          });
+          const collectComputed = (measured) => {
             const out = [];
             const fontCount = {};
             const colorCount = {};
@@ -421,12 +448,7 @@ def _extract_section_payloads(page) -> list[dict]:
             const paddingCount = {};
             const marginCount = {};
             const sizeCount = {};
-            for (const node of nodes) {
-              if (out.length >= MAX_STYLE_NODES) break;
-              const rect = node.getBoundingClientRect();
-              if (rect.width < 8 || rect.height < 8) continue;
-              const styles = getComputedStyle(node);
-              const picked = stylePick(styles);
+            for (const { node, rect, styles: picked } of measured) {
               addCount(fontCount, picked.fontFamily);
               addCount(colorCount, normalizeColor(picked.color));
               addCount(bgCount, normalizeColor(picked.backgroundColor));
@@ -440,12 +462,7 @@ def _extract_section_payloads(page) -> list[dict]:
                 text: textOf(node).slice(0, 120),
                 className: node.className || '',
                 id: node.id || '',
-                bbox: {
-                  x: Math.round(rect.x),
-                  y: Math.round(rect.y + window.scrollY),
-                  w: Math.round(rect.width),
-                  h: Math.round(rect.height),
-                },
+                bbox: bboxOf(rect),
                 styles: picked,
               });
             }
@@ -462,15 +479,8 @@ def _extract_section_payloads(page) -> list[dict]:
               },
             };
           };
-          const atomsFrom = (root) => {
-            const nodes = Array.from(
-              root.querySelectorAll('h1, h2, h3, p, li, a, button, img, video, input, textarea, select')
-            );
-            const atoms = [];
-            for (const node of nodes) {
-              if (atoms.length >= 60) break;
-              const rect = node.getBoundingClientRect();
-              if (rect.width < 8 || rect.height < 8) continue;
+          const atomsFrom = (measured) =>
+            measured.slice(0, ATOM_NODES).map(({ node, rect, styles }) => {
               const tag = node.tagName.toLowerCase();
               let kind = 'text';
               if (tag === 'h1' || tag === 'h2' || tag === 'h3') kind = 'heading';
@@ -479,8 +489,7 @@ def _extract_section_payloads(page) -> list[dict]:
               if (tag === 'input' || tag === 'textarea' || tag === 'select') kind = 'input';
               if (tag === 'img') kind = 'image';
               if (tag === 'video') kind = 'video';
-              const styles = getComputedStyle(node);
-              atoms.push({
+              return {
                 kind,
                 tag,
                 text: textOf(node).slice(0, 140),
@@ -488,17 +497,10 @@ def _extract_section_payloads(page) -> list[dict]:
                 inputType: tag === 'input' ? (node.getAttribute('type') || '') : '',
                 href: tag === 'a' ? node.getAttribute('href') || '' : '',
                 src: tag === 'img' || tag === 'video' ? node.getAttribute('src') || '' : '',
-                bbox: {
-                  x: Math.round(rect.x),
-                  y: Math.round(rect.y + window.scrollY),
-                  w: Math.round(rect.width),
-                  h: Math.round(rect.height),
-                },
-                styles: stylePick(styles),
-              });
-            }
-            return atoms;
-          };
+                bbox: bboxOf(rect),
+                styles,
+              };
+            });
           const listText = (root) =>
             Array.from(root.querySelectorAll('ul, ol')).map((list) =>
               Array.from(list.querySelectorAll('li'))
@@ -709,8 +711,9 @@ def _extract_section_payloads(page) -> list[dict]:
               const backgroundItems = bgResult.backgrounds;
               const backgroundGradients = bgResult.gradients;
               const videoItems = videos(el);
-              const computedStyles = collectComputed(el);
-              const atoms = atomsFrom(el);
+              const measured = measureNodes(el);
+              const computedStyles = collectComputed(measured);
+              const atoms = atomsFrom(measured);
               const textValue = [title, ...textItems].join(' ').trim();
               payloads.push({
                 title,
@@ -759,33 +762,11 @@ def _extract_section_payloads(page) -> list[dict]:
     )
 
 
-def _slugify(value: str) -> str:
-    return value.replace("/", "-").replace("?", "-").replace("#", "-").strip("-")
-
-
-def capture_site(url: str, output_root: Path, page_slug: str | None = None) -> dict:
-    url = _normalize_url(url)
-    domain = urlparse(url).netloc or url.replace("https://", "").split("/")[0]
-    if not page_slug:
-        page_slug = _slugify(urlparse(url).path or "home")
-        page_slug = page_slug or "home"
-    site_dir = output_root / domain
-    capture_dir = site_dir / "capture" / page_slug
-    capture_dir.mkdir(parents=True, exist_ok=True)
-
-    screenshot_path = capture_dir / "full.png"
-    dom_path = capture_dir / "dom.json"
-    sections_path = capture_dir / "sections.json"
-    groups_path = capture_dir / "section_groups.json"
-    atoms_path = capture_dir / "atoms.json"
-    theme_dir = site_dir / "theme"
-
+def _capture_page(context, url: str, capture_dir: Path, screenshot_path: Path) -> tuple:
     timeout_ms = int(os.environ.get("CAPTURE_TIMEOUT_MS", "120000"))
     wait_until = os.environ.get("CAPTURE_WAIT_UNTIL", "load")
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport={"width": 1440, "height": 900})
-        page = context.new_page()
+    page = context.new_page()
+    try:
         page.goto(url, wait_until=wait_until, timeout=timeout_ms)
         _stabilize_page(page)
         page.screenshot(path=str(screenshot_path), full_page=True)
@@ -793,7 +774,7 @@ def capture_site(url: str, output_root: Path, page_slug: str | None = None) -> d
         samples = _extract_style_samples(page)
         sections = _extract_section_boxes(page)
         section_payloads = _extract_section_payloads(page)
-        viewport = page.viewport_size or {"width": 1440, "height": 900}
+        viewport = page.viewport_size or CAPTURE_VIEWPORT
         page_height = page.evaluate("() => document.body.scrollHeight")
         section_images = []
         section_dir = capture_dir / "sections"
@@ -811,7 +792,59 @@ def capture_site(url: str, output_root: Path, page_slug: str | None = None) -> d
                 section_images.append(str(section_path))
             except Exception:
                 continue
-        browser.close()
+    finally:
+        page.close()
+    return (
+        html,
+        samples,
+        sections,
+        section_payloads,
+        viewport,
+        page_height,
+        section_images,
+    )
+
+
+def _slugify(value: str) -> str:
+    return value.replace("/", "-").replace("?", "-").replace("#", "-").strip("-")
+
+
+def capture_site(
+    url: str, output_root: Path, page_slug: str | None = None, context=None
+) -> dict:
+    url = _normalize_url(url)
+    domain = urlparse(url).netloc or url.replace("https://", "").split("/")[0]
+    if not page_slug:
+        page_slug = _slugify(urlparse(url).path or "home")
+        page_slug = page_slug or "home"
+    site_dir = output_root / domain
+    capture_dir = site_dir / "capture" / page_slug
+    capture_dir.mkdir(parents=True, exist_ok=True)
+
+    screenshot_path = capture_dir / "full.png"
+    dom_path = capture_dir / "dom.json"
+    sections_path = capture_dir / "sections.json"
+    groups_path = capture_dir / "section_groups.json"
+    atoms_path = capture_dir / "atoms.json"
+    theme_dir = site_dir / "theme"
+
+    if context is None:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context(viewport=CAPTURE_VIEWPORT)
+            captured = _capture_page(context, url, capture_dir, screenshot_path)
+            browser.close()
+    else:
+        captured = _capture_page(context, url, capture_dir, screenshot_path)
+    (
+        html,
+        samples,
+        sections,
+        section_payloads,
+        viewport,
+        page_height,
+        section_images,
+    ) = captured
 
     dom_path.write_text(
         json.dumps({"url": url, "html": html}, ensure_ascii=False, indent=2),
@@ -981,45 +1014,36 @@ def capture_site(url: str, output_root: Path, page_slug: str | None = None) -> d
         encoding="utf-8",
     )
 
-    computed_fonts: dict[str, int] = {}
-    computed_text_colors: dict[str, int] = {}
-    computed_bg_colors: dict[str, int] = {}
-    computed_radius: dict[str, int] = {}
-    computed_font_sizes: dict[str, int] = {}
-    computed_padding: dict[str, int] = {}
-    computed_margin: dict[str, int] = {}
-
-    def add_counts(bucket: dict[str, int], entries: list[dict] | None) -> None:
-        if not isinstance(entries, list):
-            return
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            value = entry.get("value")
-            count = entry.get("count") or 0
-            if not value or not isinstance(count, int):
-                continue
-            bucket[value] = bucket.get(value, 0) + count
-
+    # samples key -> section computed_styles summary key. Every section's
+    # summary is read once and all seven buckets are tallied in that visit.
+    computed_keys = (
+        ("computed_fonts", "fonts"),
+        ("computed_text_colors", "textColors"),
+        ("computed_bg_colors", "bgColors"),
+        ("computed_radius", "radius"),
+        ("computed_font_sizes", "fontSizes"),
+        ("computed_padding", "padding"),
+        ("computed_margin", "margin"),
+    )
+    computed: dict[str, dict[str, int]] = {key: {} for key, _ in computed_keys}
     for payload in section_payloads:
         if not isinstance(payload, dict):
             continue
         summary = (payload.get("computed_styles") or {}).get("summary") or {}
-        add_counts(computed_fonts, summary.get("fonts"))
-        add_counts(computed_text_colors, summary.get("textColors"))
-        add_counts(computed_bg_colors, summary.get("bgColors"))
-        add_counts(computed_radius, summary.get("radius"))
-        add_counts(computed_font_sizes, summary.get("fontSizes"))
-        add_counts(computed_padding, summary.get("padding"))
-        add_counts(computed_margin, summary.get("margin"))
-
-    samples["computed_fonts"] = computed_fonts
-    samples["computed_text_colors"] = computed_text_colors
-    samples["computed_bg_colors"] = computed_bg_colors
-    samples["computed_radius"] = computed_radius
-    samples["computed_font_sizes"] = computed_font_sizes
-    samples["computed_padding"] = computed_padding
-    samples["computed_margin"] = computed_margin
+        for sample_key, summary_key in computed_keys:
+            entries = summary.get(summary_key)
+            if not isinstance(entries, list):
+                continue
+            bucket = computed[sample_key]
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                value = entry.get("value")
+                count = entry.get("count") or 0
+                if not value or not isinstance(count, int):
+                    continue
+                bucket[value] = bucket.get(value, 0) + count
+    samples.update(computed)
 
     tokens = build_theme_tokens(samples)
     tokens_path, theme_path, theme_json_path = write_theme_files(tokens, theme_dir)
@@ -1036,3 +1060,55 @@ def capture_site(url: str, output_root: Path, page_slug: str | None = None) -> d
         "theme_json": str(theme_json_path),
         "page_slug": page_slug,
     }
+
+
+
+class CaptureSession:
+    # Keeps one Chromium browser and context alive across capture() calls:
+    # Chromium starts once per run, and cookies set on the first page (consent
+    # banners) carry over. Playwright's sync API claims its thread's event
+    # loop, which would break the asyncio.run() calls the pipeline makes
+    # between captures, so the browser lives on its own worker thread.
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="capture"
+        )
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    def _get_context(self):
+        if self._context is None:
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._context = self._browser.new_context(viewport=CAPTURE_VIEWPORT)
+        return self._context
+
+    def capture(
+        self, url: str, output_root: Path, page_slug: str | None = None
+    ) -> dict:
+        def run() -> dict:
+            context = self._get_context()
+            return capture_site(url, output_root, page_slug, context=context)
+
+        return self._executor.submit(run).result()
+
+    def _shutdown_browser(self) -> None:
+        if self._browser is not None:
+            self._browser.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._playwright = self._browser = self._context = None
+
+    def close(self) -> None:
+        try:
+            self._executor.submit(self._shutdown_browser).result()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self) -> CaptureSession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+import functools
 import json
 from pathlib import Path
+from typing import Iterator
 from urllib.parse import urlparse, urljoin
 from urllib.request import urlopen
 
 from bs4 import BeautifulSoup
 
+try:
+    import httpx
+except Exception:
+    httpx = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except Exception:
+    HTMLParser = None
+
 
 def _normalize_url(url: str) -> str:
     url = url.strip()
@@ -16,31 +28,68 @@ def _normalize_url(url: str) -> str:
     return url
 
 
-def _same_domain(base: str, target: str) -> bool:
-    return urlparse(base).netloc == urlparse(target).netloc
+@functools.lru_cache(maxsize=1)
+def _http_client() -> "httpx.Client":
+    # robots.txt, the sitemaps and the homepage all live on one host, so a
+    # keep-alive client pays for TCP and TLS setup once.
+    return httpx.Client(timeout=20, follow_redirects=True)
 
 
 def _fetch(url: str) -> str:
+    if httpx is not None:
+        response = _http_client().get(url)
+        response.raise_for_status()
+        return response.content.decode("utf-8", errors="ignore")
     with urlopen(url, timeout=20) as response:
         return response.read().decode("utf-8", errors="ignore")
 
 
-def _parse_sitemap(xml_content: str) -> list[str]:
-    urls = []
+def _parse_sitemap(xml_content: str, chunk_size: int = 65536) -> Iterator[str]:
+    """Yield <loc> URLs while the sitemap is parsed, chunk by chunk.
+
+    Sitemaps can list tens of thousands of URLs and discovery needs only the
+    first few, so nothing is materialized: consumed elements are cleared and
+    the caller can stop early. A truncated or malformed sitemap yields the
+    URLs before the error.
+    """
+    parser = ET.XMLPullParser(events=("end",))
     try:
-        root = ET.fromstring(xml_content)
+        for start in range(0, len(xml_content) + 1, chunk_size):
+            chunk = xml_content[start : start + chunk_size]
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            for _, elem in parser.read_events():
+                if elem.tag.endswith("loc") and elem.text:
+                    yield elem.text.strip()
+                elem.clear()
     except ET.ParseError:
-        return urls
-    for loc in root.iter():
-        if loc.tag.endswith("loc") and loc.text:
-            urls.append(loc.text.strip())
-    return urls
+        return
+
+
+def _page_hrefs(html: str) -> Iterator[str]:
+    # Only <a href> values are needed, so the C lexbor parser is used when
+    # selectolax is installed instead of building a BeautifulSoup tree.
+    if HTMLParser is not None:
+        for node in HTMLParser(html).css("a[href]"):
+            yield node.attributes.get("href") or ""
+        return
+    for link in BeautifulSoup(html, "html.parser").find_all("a"):
+        yield link.get("href") or ""
 
 
 def discover_urls(base_url: str, max_pages: int = 10) -> list[str]:
     base_url = _normalize_url(base_url)
     domain = urlparse(base_url).netloc
-    discovered: list[str] = []
+    # Normalized same-domain URLs in discovery order (dict as ordered set).
+    unique: dict[str, None] = {}
+
+    def add(url: str) -> None:
+        parsed = urlparse(url)
+        if parsed.netloc == domain:
+            normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
+            unique.setdefault(normalized)
 
     sitemap_urls = []
     try:
@@ -55,43 +104,27 @@ def discover_urls(base_url: str, max_pages: int = 10) -> list[str]:
         sitemap_urls = [urljoin(base_url, "/sitemap.xml")]
 
     for sitemap_url in sitemap_urls:
+        if len(unique) >= max_pages:
+            break
         try:
             sitemap_xml = _fetch(sitemap_url)
-            for url in _parse_sitemap(sitemap_xml):
-                if _same_domain(base_url, url):
-                    discovered.append(url)
         except Exception:
             continue
+        for url in _parse_sitemap(sitemap_xml):
+            add(url)
+            if len(unique) >= max_pages:
+                break
 
-    if not discovered:
+    if not unique:
         try:
-            html = _fetch(base_url)
-            soup = BeautifulSoup(html, "html.parser")
-            for link in soup.find_all("a"):
-                href = link.get("href")
-                if not href:
-                    continue
-                absolute = urljoin(base_url, href)
-                if _same_domain(base_url, absolute):
-                    discovered.append(absolute)
+            for href in _page_hrefs(_fetch(base_url)):
+                if href:
+                    add(urljoin(base_url, href))
         except Exception:
-            discovered = [base_url]
-
-    unique = []
-    seen = set()
-    for url in discovered:
-        parsed = urlparse(url)
-        if parsed.netloc != domain:
-            continue
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        unique.append(normalized)
-        if len(unique) >= max_pages:
-            break
+            unique.clear()
+            add(base_url)
 
-    return unique or [base_url]
+    return list(unique)[:max_pages] or [base_url]
 
 
 def write_discovered(urls: list[str], output_dir: Path) -> Path:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
 import re
@@ -10,6 +11,11 @@ from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
 
+try:
+    import httpx
+except Exception:
+    httpx = None
+
 
 def _load_dotenv() -> None:
     env_path = Path(__file__).resolve().parents[2] / ".env"
@@ -38,6 +44,20 @@ def _normalize_url(url: str) -> str:
 PRICE_RE = re.compile(
     r"(?:[$€£]\s?\d+(?:[.,]\d+)?|\d+(?:[.,]\d+)?\s?(?:usd|eur|gbp))", re.I
 )
+CSS_URL_RE = re.compile(r"url\([\"']?([^\"')]+)[\"']?\)")
+FONT_URL_RE = re.compile(r"url\(['\"]?(https?://[^'\")]+)['\"]?\)")
+CSS_IMPORT_RE = re.compile(r"@import\s+url\(['\"]?(.*?)['\"]?\)")
+TERM_RE = re.compile(r"[a-z0-9]{3,}")
+COPY_SIGNAL_RES = {
+    "pricing": re.compile(r"\bpricing|price|plan|/mo|/yr|\$\d"),
+    "faq": re.compile(r"\bfaq|question|answers?\b"),
+    "trust": re.compile(
+        r"\b(testimonial|case study|logo cloud|trusted by|customers?)\b"
+    ),
+    "conversion": re.compile(
+        r"\b(contact|demo|get started|signup|sign up|book|trial)\b"
+    ),
+}
 INDUSTRY_KEYWORDS = {
     "defense": ["defense", "military", "mission", "tactical", "secure"],
     "aerospace": ["satellite", "orbit", "space", "aerospace"],
@@ -56,10 +76,46 @@ INDUSTRY_KEYWORDS = {
 def _extract_prices(text: str) -> list[str]:
     return list(dict.fromkeys([match.group(0).strip() for match in PRICE_RE.finditer(text)]))
 
+@functools.lru_cache(maxsize=1)
+def _http_client() -> "httpx.Client":
+    # Font stylesheets and the font files they reference come from a couple
+    # of CDN hosts; one keep-alive client reuses those connections.
+    return httpx.Client(timeout=10, follow_redirects=True)
+
+
+def _fetch_bytes(url: str) -> bytes | None:
+    """GET `url`, returning None for an error status."""
+    if httpx is not None:
+        response = _http_client().get(url)
+        if response.status_code < 200 or response.status_code >= 400:
+            return None
+        return response.content
+    import urllib.request
+
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        if resp.status and (resp.status < 200 or resp.status >= 400):
+            return None
+        return resp.read()
+
+
+def _is_font_url(href: str) -> bool:
+    href_lower = href.lower()
+    return (
+        "fonts.googleapis.com" in href_lower
+        or "use.typekit.net" in href_lower
+        or "fonts.cdnfonts.com" in href_lower
+        or "fonts." in href_lower
+    )
+
+
+# Font stylesheets list one file per weight and unicode subset. Only the
+# first few are inlined; the rest keep their remote url().
+MAX_INLINED_FONTS = 8
+
+
 def _download_font_css(urls: list[str]) -> str:
     if not urls:
         return ""
-    import urllib.request
     import base64
     import mimetypes
     from urllib.parse import urlparse
@@ -67,10 +123,7 @@ def _download_font_css(urls: list[str]) -> str:
     css_parts: list[str] = []
     for url in urls[:4]:
         try:
-            with urllib.request.urlopen(url, timeout=10) as resp:
-                if resp.status and (resp.status < 200 or resp.status >= 400):
-                    continue
-                data = resp.read()
+            data = _fetch_bytes(url)
             if data:
                 text = data.decode("utf-8", errors="ignore")
                 if len(text) > 200_000:
@@ -81,29 +134,29 @@ def _download_font_css(urls: list[str]) -> str:
     css = "\n".join(css_parts)
     if not css:
         return css
-    url_re = re.compile(r"url\\(['\\\"]?(https?://[^'\\\")]+)['\\\"]?\\)")
-    cache: dict[str, str] = {}
+    cache: dict[str, str | None] = {}
 
-    def replace(match: re.Match) -> str:
-        font_url = match.group(1)
-        if font_url in cache:
-            return f"url('{cache[font_url]}')"
+    def inline(font_url: str) -> str | None:
         try:
-            with urllib.request.urlopen(font_url, timeout=10) as resp:
-                if resp.status and (resp.status < 200 or resp.status >= 400):
-                    return match.group(0)
-                data = resp.read()
+            data = _fetch_bytes(font_url)
             if not data or len(data) > 1_000_000:
-                return match.group(0)
+                return None
             mime = mimetypes.guess_type(urlparse(font_url).path)[0] or "font/woff2"
             encoded = base64.b64encode(data).decode("ascii")
-            data_url = f"data:{mime};base64,{encoded}"
-            cache[font_url] = data_url
-            return f"url('{data_url}')"
+            return f"data:{mime};base64,{encoded}"
         except Exception:
-            return match.group(0)
+            return None
+
+    def replace(match: re.Match) -> str:
+        font_url = match.group(1)
+        if font_url not in cache:
+            if len(cache) >= MAX_INLINED_FONTS:
+                return match.group(0)
+            cache[font_url] = inline(font_url)
+        data_url = cache[font_url]
+        return f"url('{data_url}')" if data_url else match.group(0)
 
-    css = url_re.sub(replace, css)
+    css = FONT_URL_RE.sub(replace, css)
     return css
 
 
@@ -175,7 +228,7 @@ def _build_section_payload(
 def _extract_backgrounds_from_style(style: str) -> list[str]:
     if not style:
         return []
-    urls = re.findall(r"url\\([\"']?([^\"')]+)[\"']?\\)", style)
+    urls = CSS_URL_RE.findall(style)
     return [url.strip() for url in urls if url.strip()]
 
 
@@ -431,7 +484,7 @@ def _infer_industry_tags(text_blob: str) -> list[str]:
 
 def _top_terms(headings: list[str], paragraphs: list[str], limit: int = 8) -> list[str]:
     text = " ".join([*headings, *paragraphs]).lower()
-    words = re.findall(r"[a-z0-9]{3,}", text)
+    words = TERM_RE.findall(text)
     stopwords = {
         "the",
         "and",
@@ -499,19 +552,7 @@ def _compute_copy_assets(
 ) -> dict:
     text_blob = " ".join([*headings, *paragraphs]).lower()
     signals = {
-        "pricing": bool(re.search(r"\bpricing|price|plan|/mo|/yr|\$\d", text_blob)),
-        "faq": bool(re.search(r"\bfaq|question|answers?\b", text_blob)),
-        "trust": bool(
-            re.search(
-                r"\b(testimonial|case study|logo cloud|trusted by|customers?)\b",
-                text_blob,
-            )
-        ),
-        "conversion": bool(
-            re.search(
-                r"\b(contact|demo|get started|signup|sign up|book|trial)\b", text_blob
-            )
-        ),
+        key: bool(pattern.search(text_blob)) for key, pattern in COPY_SIGNAL_RES.items()
     }
     cta_labels = [
         (item.get("label") or "").strip().lower()
@@ -567,7 +608,7 @@ def _compute_copy_assets(
         "recommendations": recommendations,
     }
 
-async def extract_site(url: str, output_root: Path) -> dict:
+def _prepare_site(url: str, output_root: Path) -> tuple[str, str, Path]:
     url = _normalize_url(url)
     domain = urlparse(url).netloc or url.replace("https://", "").split("/")[0]
     site_dir = output_root / domain
@@ -582,6 +623,13 @@ async def extract_site(url: str, output_root: Path) -> dict:
         )
     os.environ["HOME"] = str(site_dir)
     os.environ["XDG_CACHE_HOME"] = str(crawl_home)
+    return url, domain, extract_dir
+
+
+async def extract_site(
+    url: str, output_root: Path, crawler: AsyncWebCrawler | None = None
+) -> dict:
+    url, domain, extract_dir = _prepare_site(url, output_root)
 
     config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
@@ -589,7 +637,10 @@ async def extract_site(url: str, output_root: Path) -> dict:
         word_count_threshold=5,
     )
 
-    async with AsyncWebCrawler() as crawler:
+    if crawler is None:
+        async with AsyncWebCrawler() as crawler:
+            result = await crawler.arun(url=url, config=config)
+    else:
         result = await crawler.arun(url=url, config=config)
 
     markdown = result.markdown or ""
@@ -597,32 +648,30 @@ async def extract_site(url: str, output_root: Path) -> dict:
     soup = BeautifulSoup(html, "html.parser")
 
     title = soup.title.string.strip() if soup.title and soup.title.string else ""
-    headings = [h.get_text(strip=True) for h in soup.find_all(["h1", "h2", "h3"])][:20]
-    paragraphs = [p.get_text(strip=True) for p in soup.find_all("p")][:30]
-    font_links: list[str] = []
-    for link in soup.find_all("link"):
-        rel = " ".join(link.get("rel") or []).lower()
-        href = link.get("href") or ""
-        if "stylesheet" in rel and href:
-            href_lower = href.lower()
-            if (
-                "fonts.googleapis.com" in href_lower
-                or "use.typekit.net" in href_lower
-                or "fonts.cdnfonts.com" in href_lower
-                or "fonts." in href_lower
-            ):
-                font_links.append(href)
-    for style in soup.find_all("style"):
-        text = style.get_text() or ""
-        for match in re.findall(r"@import\\s+url\\(['\\\"]?(.*?)['\\\"]?\\)", text):
-            href_lower = match.lower()
-            if (
-                "fonts.googleapis.com" in href_lower
-                or "use.typekit.net" in href_lower
-                or "fonts.cdnfonts.com" in href_lower
-                or "fonts." in href_lower
-            ):
-                font_links.append(match)
+    # One walk over the tree for headings, paragraphs and font sources instead
+    # of a find_all() per tag; the capped lists skip get_text() once full.
+    headings: list[str] = []
+    paragraphs: list[str] = []
+    link_fonts: list[str] = []
+    import_fonts: list[str] = []
+    for el in soup.find_all(["h1", "h2", "h3", "p", "link", "style"]):
+        name = el.name
+        if name == "p":
+            if len(paragraphs) < 30:
+                paragraphs.append(el.get_text(strip=True))
+        elif name == "link":
+            rel = " ".join(el.get("rel") or []).lower()
+            href = el.get("href") or ""
+            if "stylesheet" in rel and href and _is_font_url(href):
+                link_fonts.append(href)
+        elif name == "style":
+            text = el.get_text() or ""
+            import_fonts.extend(
+                href for href in CSS_IMPORT_RE.findall(text) if _is_font_url(href)
+            )
+        elif len(headings) < 20:
+            headings.append(el.get_text(strip=True))
+    font_links = link_fonts + import_fonts
     sections = _extract_sections(soup)
     texts = [item for section in sections for item in section.get("texts", [])]
     buttons = [item for section in sections for item in section.get("buttons", [])]
@@ -631,7 +680,8 @@ async def extract_site(url: str, output_root: Path) -> dict:
     prices = [item for section in sections for item in section.get("prices", [])]
     images = [item for section in sections for item in section.get("images", [])]
     font_links = list(dict.fromkeys(font_links))
-    font_css = _download_font_css(font_links)
+    # Stylesheet and font downloads are blocking; keep them off the loop.
+    font_css = await asyncio.to_thread(_download_font_css, font_links)
     content_assets = _compute_copy_assets(
         headings, paragraphs, sections, buttons, links, prices
     )
@@ -666,3 +716,45 @@ async def extract_site(url: str, output_root: Path) -> dict:
 
 def extract_site_sync(url: str, output_root: Path) -> dict:
     return asyncio.run(extract_site(url, output_root))
+
+
+class ExtractSession:
+    # Keeps one crawl4ai crawler (and its Chromium) alive across extract()
+    # calls instead of starting a browser per page. The crawler is bound to
+    # the event loop it started on, so the session owns a private loop and
+    # runs each extraction on it; asyncio.run() elsewhere in the pipeline
+    # still works between calls.
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._crawler: AsyncWebCrawler | None = None
+
+    async def _extract(self, url: str, output_root: Path) -> dict:
+        if self._crawler is None:
+            # HOME and the Playwright browser path must point at the site
+            # before Chromium starts, as they do for a one-off extraction.
+            _prepare_site(url, output_root)
+            self._crawler = await AsyncWebCrawler().start()
+        return await extract_site(url, output_root, crawler=self._crawler)
+
+    def extract(self, url: str, output_root: Path) -> dict:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._extract(url, output_root))
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        try:
+            if self._crawler is not None:
+                self._loop.run_until_complete(self._crawler.close())
+        finally:
+            self._crawler = None
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self) -> ExtractSession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1851,7 +1851,9 @@ def _repair_structure(
 def _average_hash(image) -> str:
     from PIL import Image
 
-    resized = image.resize((8, 8), Image.Resampling.LANCZOS).convert("L")
+    resized = image.resize((8, 8), Image.Resampling.LANCZOS)
+    if resized.mode != "L":
+        resized = resized.convert("L")
     pixels = list(resized.getdata())
     avg = sum(pixels) / len(pixels)
     bits = "".join("1" if p >= avg else "0" for p in pixels)
@@ -1874,7 +1876,10 @@ def _extract_visual_hashes(
             {"visual_hash": None, "error": "screenshot missing"} for _ in section_boxes
         ]
 
-    image = Image.open(screenshot_path)
+    # Convert the page to luma once: every crop is then resampled on one
+    # channel instead of three or four, which is most of the hashing cost.
+    with Image.open(screenshot_path) as screenshot:
+        image = screenshot.convert("L")
     hashes = []
     for box in section_boxes:
         left = max(int(box.get("left", 0)), 0)
@@ -12,9 +12,9 @@ import socket
 import urllib.request
 
 from build import build_pages
-from capture import capture_site
+from capture import CaptureSession
 from discover import discover_urls, write_discovered
-from extract import extract_site_sync
+from extract import ExtractSession
 from map import map_sections
 from llm_filler import apply_media_plan, fill_sections, generate_theme_and_media_plan
 from atoms_dsl import build_atoms_dsl
@@ -351,102 +351,103 @@ def run_pipeline(
         json.dumps(site_plan, ensure_ascii=False, indent=2), encoding="utf-8"
     )
     site_files = _write_site_files(site_plan, output_root, domain)
-    for url in urls:
-        page_slug = _slug_from_url(url)
-        capture_result = capture_site(url, output_root, page_slug=page_slug)
-        extract_result = extract_site_sync(url, output_root)
-        capture_data = {}
-        if capture_result.get("sections"):
-            sections_path = Path(capture_result["sections"])
-            if sections_path.exists():
-                capture_data = json.loads(sections_path.read_text(encoding="utf-8"))
-                capture_data["screenshot"] = capture_result.get("screenshot")
-        if capture_result.get("atoms"):
-            atoms_path = Path(capture_result["atoms"])
-            if atoms_path.exists():
-                build_atoms_dsl(atoms_path, output_root, domain, page_slug)
-                build_atomic_assets(output_root, domain, page_slug)
-                tag_semantics(output_root, domain, page_slug, use_llm=True)
-        map_result = map_sections(
-            extract_result,
-            registry_path,
-            output_root,
-            capture_data,
-            page_slug,
-            _page_plan(site_plan, page_slug),
-        )
-        design_system_result = build_design_system(output_root, domain, page_slug)
-        media_plan = None
-        theme_tokens = None
-        if fill_props:
-            theme_result = generate_theme_and_media_plan(
-                Path(map_result["path"]), output_root, max_retries=1
+    with CaptureSession() as capture, ExtractSession() as extractor:
+        for url in urls:
+            page_slug = _slug_from_url(url)
+            capture_result = capture.capture(url, output_root, page_slug=page_slug)
+            extract_result = extractor.extract(url, output_root)
+            capture_data = {}
+            if capture_result.get("sections"):
+                sections_path = Path(capture_result["sections"])
+                if sections_path.exists():
+                    capture_data = json.loads(sections_path.read_text(encoding="utf-8"))
+                    capture_data["screenshot"] = capture_result.get("screenshot")
+            if capture_result.get("atoms"):
+                atoms_path = Path(capture_result["atoms"])
+                if atoms_path.exists():
+                    build_atoms_dsl(atoms_path, output_root, domain, page_slug)
+                    build_atomic_assets(output_root, domain, page_slug)
+                    tag_semantics(output_root, domain, page_slug, use_llm=True)
+            map_result = map_sections(
+                extract_result,
+                registry_path,
+                output_root,
+                capture_data,
+                page_slug,
+                _page_plan(site_plan, page_slug),
             )
-            if theme_result.get("status") in {"ok", "fallback"}:
-                media_plan = theme_result.get("media_plan") or []
-                theme_tokens = theme_result.get("theme") or {}
-            fill_sections(
-                Path(map_result["path"]),
-                ASSET_FACTORY_ROOT / "schemas/blocks",
-                ASSET_FACTORY_ROOT / "prompts/props_filler.md",
-                output_root / domain / "logs" / f"llm-fill-{page_slug}.json",
-                max_retries=2,
-            )
-            if media_plan and theme_tokens:
-                apply_media_plan(Path(map_result["path"]), media_plan, theme_tokens)
-        build_result = build_pages(
-            extract_result, map_result, output_root, page_slug=page_slug
-        )
-        report = verify_outputs(domain, output_root, page_slug=page_slug)
-        render_base = "http://localhost:3000/"
-        render_url = f"http://localhost:3000/render?siteKey={domain}&page={page_slug}"
-        healthy, note = ensure_render_server(render_base, render_url=render_url)
-        if healthy:
-            vqa_code, vqa_out = run_visual_qa(domain, url, render_url)
-            report2 = verify_outputs(domain, output_root, page_slug=page_slug)
-        else:
-            vqa_code, vqa_out = 1, f"render_server_unavailable: {note}"
-            report2 = report
-        auto_repair_status = {"status": "skipped"}
-        if os.environ.get("AUTO_REPAIR", "0") == "1":
-            loop_code, loop_out = run_visual_auto_repair(
-                domain,
-                url,
-                Path(build_result["page"]),
-                "http://localhost:3000/render",
-            )
-            repair_apply = None
-            if loop_code == 0:
-                repair_apply = _apply_auto_repair_result(
-                    domain, page_slug, Path(build_result["page"])
+            design_system_result = build_design_system(output_root, domain, page_slug)
+            media_plan = None
+            theme_tokens = None
+            if fill_props:
+                theme_result = generate_theme_and_media_plan(
+                    Path(map_result["path"]), output_root, max_retries=1
+                )
+                if theme_result.get("status") in {"ok", "fallback"}:
+                    media_plan = theme_result.get("media_plan") or []
+                    theme_tokens = theme_result.get("theme") or {}
+                fill_sections(
+                    Path(map_result["path"]),
+                    ASSET_FACTORY_ROOT / "schemas/blocks",
+                    ASSET_FACTORY_ROOT / "prompts/props_filler.md",
+                    output_root / domain / "logs" / f"llm-fill-{page_slug}.json",
+                    max_retries=2,
                 )
+                if media_plan and theme_tokens:
+                    apply_media_plan(Path(map_result["path"]), media_plan, theme_tokens)
+            build_result = build_pages(
+                extract_result, map_result, output_root, page_slug=page_slug
+            )
+            report = verify_outputs(domain, output_root, page_slug=page_slug)
+            render_base = "http://localhost:3000/"
+            render_url = f"http://localhost:3000/render?siteKey={domain}&page={page_slug}"
+            healthy, note = ensure_render_server(render_base, render_url=render_url)
+            if healthy:
+                vqa_code, vqa_out = run_visual_qa(domain, url, render_url)
                 report2 = verify_outputs(domain, output_root, page_slug=page_slug)
-            auto_repair_status = {
-                "status": "ok" if loop_code == 0 else "failed",
-                "output": loop_out[-2000:],
-                "apply": repair_apply if loop_code == 0 else None,
-            }
-        library_result = {"status": "skipped"}
-        atomic_result = {"status": "skipped"}
-        if ingest_library:
-            library_result = ingest_library_assets(output_root, domain, page_slug)
-            atomic_result = ingest_atomic_assets(output_root, domain, page_slug)
-        elif ingest_atomics:
-            atomic_result = ingest_atomic_assets(output_root, domain, page_slug)
-        results.append(
-            {
-                "capture": capture_result,
-                "extract": extract_result,
-                "map": map_result,
-                "build": build_result,
-                "visual_qa": {"status": "ok" if vqa_code == 0 else "failed", "output": vqa_out[-2000:]},
-                "report": report2,
-                "auto_repair": auto_repair_status,
-                "design_system": design_system_result,
-                "library": library_result,
-                "atomics": atomic_result,
-            }
-        )
+            else:
+                vqa_code, vqa_out = 1, f"render_server_unavailable: {note}"
+                report2 = report
+            auto_repair_status = {"status": "skipped"}
+            if os.environ.get("AUTO_REPAIR", "0") == "1":
+                loop_code, loop_out = run_visual_auto_repair(
+                    domain,
+                    url,
+                    Path(build_result["page"]),
+                    "http://localhost:3000/render",
+                )
+                repair_apply = None
+                if loop_code == 0:
+                    repair_apply = _apply_auto_repair_result(
+                        domain, page_slug, Path(build_result["page"])
+                    )
+                    report2 = verify_outputs(domain, output_root, page_slug=page_slug)
+                auto_repair_status = {
+                    "status": "ok" if loop_code == 0 else "failed",
+                    "output": loop_out[-2000:],
+                    "apply": repair_apply if loop_code == 0 else None,
+                }
+            library_result = {"status": "skipped"}
+            atomic_result = {"status": "skipped"}
+            if ingest_library:
+                library_result = ingest_library_assets(output_root, domain, page_slug)
+                atomic_result = ingest_atomic_assets(output_root, domain, page_slug)
+            elif ingest_atomics:
+                atomic_result = ingest_atomic_assets(output_root, domain, page_slug)
+            results.append(
+                {
+                    "capture": capture_result,
+                    "extract": extract_result,
+                    "map": map_result,
+                    "build": build_result,
+                    "visual_qa": {"status": "ok" if vqa_code == 0 else "failed", "output": vqa_out[-2000:]},
+                    "report": report2,
+                    "auto_repair": auto_repair_status,
+                    "design_system": design_system_result,
+                    "library": library_result,
+                    "atomics": atomic_result,
+                }
+            )
 
     return {
         "domain": domain,
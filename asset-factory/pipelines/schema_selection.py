@@ -1,25 +1,90 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
-def _schema_ref(schema_path: Path) -> str:
-    return schema_path.as_uri()
+@lru_cache(maxsize=64)
+def _load_schema_cached(path_str: str, mtime_ns: int) -> dict:
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+
+def _load_schema(path: Path) -> dict:
+    # Keyed on mtime so a long-running process picks up schema edits; the
+    # result is shared, callers must not mutate it.
+    return _load_schema_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _scan_dir(path_str: str, mtime_ns: int) -> frozenset[str]:
+    return frozenset(entry.name for entry in os.scandir(path_str))
+
+
+def _dir_names(directory: Path) -> frozenset[str]:
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _scan_dir(str(directory), mtime_ns)
+
+
+def _resolve_pointer(document: dict, pointer: str):
+    node = document
+    for part in pointer.lstrip("/").split("/"):
+        if not part:
+            continue
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+def _inline_refs(node, base_path: Path, visiting: frozenset = frozenset()):
+    """Replace every $ref with the referenced sub-schema so validation never
+    has to resolve references at runtime.
+
+    `visiting` holds the (file, pointer) refs being expanded on the current
+    path; meeting one again means the schema is recursive and cannot be
+    inlined.
+    """
+    if isinstance(node, list):
+        return [_inline_refs(item, base_path, visiting) for item in node]
+    if not isinstance(node, dict):
+        return node
+    ref = node.get("$ref")
+    if isinstance(ref, str):
+        target, _, pointer = ref.partition("#")
+        target_path = (base_path.parent / target).resolve() if target else base_path
+        ref_key = (str(target_path), pointer)
+        if ref_key in visiting:
+            raise ValueError(f"Cyclic $ref {ref!r} in {base_path} cannot be inlined")
+        resolved = _resolve_pointer(_load_schema(target_path), pointer)
+        inlined = _inline_refs(
+            copy.deepcopy(resolved), target_path, visiting | {ref_key}
+        )
+        siblings = {key: value for key, value in node.items() if key != "$ref"}
+        if not siblings:
+            return inlined
+        return {"allOf": [inlined, _inline_refs(siblings, base_path, visiting)]}
+    return {
+        key: _inline_refs(value, base_path, visiting) for key, value in node.items()
+    }
 
 
 def build_selection_schema(
     candidates: list[dict], schema_dir: Path, output_path: Path
 ) -> Path:
     variants = []
+    schema_names = _dir_names(schema_dir)
     for candidate in candidates:
         block_type = candidate.get("type")
         if not block_type:
             continue
         name = block_type.replace(".v", "-v").lower()
-        schema_path = schema_dir / f"{name}.json"
-        if not schema_path.exists():
+        if f"{name}.json" not in schema_names:
             continue
+        schema_path = schema_dir / f"{name}.json"
         variants.append(
             {
                 "type": "object",
@@ -28,7 +93,10 @@ def build_selection_schema(
                 "properties": {
                     "type": {"const": block_type},
                     "variant": {"type": "string"},
-                    "props": {"$ref": f"{_schema_ref(schema_path)}#/properties/props"},
+                    "props": _inline_refs(
+                        _load_schema(schema_path.resolve())["properties"]["props"],
+                        schema_path.resolve(),
+                    ),
                 },
             }
         )
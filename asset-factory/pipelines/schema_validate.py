@@ -1,16 +1,52 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import fastjsonschema
+except Exception:
+    fastjsonschema = None
+
+
+@lru_cache(maxsize=64)
+def _load_validator(
+    path_str: str, mtime_ns: int
+) -> tuple[dict, Callable[[Any], Any] | None]:
+    # Keyed on (path, mtime) so an edited schema is re-read and recompiled;
+    # the LRU bound keeps superseded versions from piling up.
+    schema = json.loads(Path(path_str).read_text(encoding="utf-8"))
+    if fastjsonschema is None:
+        return schema, None
+    try:
+        # fastjsonschema has no 2020-12 support: it compiles these schemas
+        # with draft-07 rules. The keywords used here behave the same, and
+        # $defs is only reached through plain $ref pointers.
+        return schema, fastjsonschema.compile(schema)
+    except Exception:
+        # Features fastjsonschema does not support ($dynamicRef, ...) fall
+        # back to the jsonschema engine.
+        return schema, None
 
 
 def validate_json(instance: dict, schema_path: Path) -> tuple[bool, list[str]]:
+    schema, compiled = _load_validator(
+        str(schema_path), schema_path.stat().st_mtime_ns
+    )
+    if compiled is not None:
+        try:
+            compiled(instance)
+        except fastjsonschema.JsonSchemaException as exc:
+            return False, [exc.message]
+        return True, []
+
     try:
         import jsonschema
     except Exception:
         return True, []
 
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
     validator = jsonschema.Draft202012Validator(schema)
     errors = [error.message for error in validator.iter_errors(instance)]
     return not errors, errors
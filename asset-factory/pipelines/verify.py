@@ -2,13 +2,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 VISUAL_QA_OUT = REPO_ROOT / "asset-factory" / "out"
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_CONTACT_SCHEMES = ("mailto:", "tel:", "sms:")
+_HTTP_SCHEMES = ("http:", "https:")
+
+_COMPONENTS_KEY_RE = re.compile(r"\bcomponents\s*:\s*\{")
+# Either a `Name: {` key at the start of a line or a single brace.
+_COMPONENT_SCAN_RE = re.compile(r"^[^\S\n]*([A-Za-z0-9]+)[^\S\n]*:[^\S\n]*\{|[{}]", re.M)
+
 
 def _parse_hsl(value: str) -> tuple[float, float, float] | None:
     if not value:
@@ -25,113 +41,253 @@ def _parse_hsl(value: str) -> tuple[float, float, float] | None:
     return h, s, l
 
 
+def _jit(func):
+    """Compile numeric kernels with numba when VERIFY_NUMBA=1.
+
+    Off by default: a report only needs a couple of memoized contrast ratios,
+    so importing numba (~0.35s) and JIT-compiling (~0.2s) cost more than the
+    kernels save. Large batches go through _batch_contrast_ratio instead.
+    """
+    if os.environ.get("VERIFY_NUMBA", "0") != "1":
+        return func
+    try:
+        from numba import njit
+    except Exception:
+        return func
+    return njit(cache=True)(func)
+
+
+@_jit
 def _hsl_to_rgb(h: float, s: float, l: float) -> tuple[float, float, float]:
     c = (1 - abs(2 * l - 1)) * s
     x = c * (1 - abs((h / 60) % 2 - 1))
     m = l - c / 2
     if 0 <= h < 60:
-        r, g, b = c, x, 0
+        r, g, b = c, x, 0.0
     elif 60 <= h < 120:
-        r, g, b = x, c, 0
+        r, g, b = x, c, 0.0
     elif 120 <= h < 180:
-        r, g, b = 0, c, x
+        r, g, b = 0.0, c, x
     elif 180 <= h < 240:
-        r, g, b = 0, x, c
+        r, g, b = 0.0, x, c
     elif 240 <= h < 300:
-        r, g, b = x, 0, c
+        r, g, b = x, 0.0, c
     else:
-        r, g, b = c, 0, x
+        r, g, b = c, 0.0, x
     return r + m, g + m, b + m
 
 
-def _relative_luminance(rgb: tuple[float, float, float]) -> float:
-    def adjust(c: float) -> float:
-        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+@_jit
+def _srgb_linear(c: float) -> float:
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
 
+@_jit
+def _relative_luminance(rgb: tuple[float, float, float]) -> float:
     r, g, b = rgb
-    return 0.2126 * adjust(r) + 0.7152 * adjust(g) + 0.0722 * adjust(b)
+    return 0.2126 * _srgb_linear(r) + 0.7152 * _srgb_linear(g) + 0.0722 * _srgb_linear(b)
+
+
+@lru_cache(maxsize=256)
+def _token_luminance(value: str) -> float | None:
+    hsl = _parse_hsl(value)
+    if not hsl:
+        return None
+    return _relative_luminance(_hsl_to_rgb(*hsl))
 
 
 def _contrast_ratio(a: str, b: str) -> float | None:
-    hsl_a = _parse_hsl(a)
-    hsl_b = _parse_hsl(b)
-    if not hsl_a or not hsl_b:
+    l1 = _token_luminance(a)
+    l2 = _token_luminance(b)
+    if l1 is None or l2 is None:
         return None
-    rgb_a = _hsl_to_rgb(*hsl_a)
-    rgb_b = _hsl_to_rgb(*hsl_b)
-    l1 = _relative_luminance(rgb_a)
-    l2 = _relative_luminance(rgb_b)
     lighter = max(l1, l2)
     darker = min(l1, l2)
     return round((lighter + 0.05) / (darker + 0.05), 2)
 
 
+def _batch_luminance(np, hsl):
+    h, s, l = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+    c = (1 - np.abs(2 * l - 1)) * s
+    x = c * (1 - np.abs((h / 60) % 2 - 1))
+    m = l - c / 2
+    zero = np.zeros_like(c)
+    sextants = [h < 60, h < 120, h < 180, h < 240, h < 300]
+    r = np.select(sextants, [c, x, zero, zero, x], c) + m
+    g = np.select(sextants, [x, c, c, x, zero], zero) + m
+    b = np.select(sextants, [zero, zero, x, c, c], x) + m
+    rgb = np.stack([r, g, b], axis=1)
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+# Below this many pairs the memoized scalar path beats numpy's setup cost.
+_VECTORIZE_MIN_PAIRS = 32
+
+
+def _batch_contrast_ratio(pairs: list[tuple[str, str]]) -> list[float | None]:
+    """Contrast ratios for many (a, b) token pairs, vectorized when large."""
+    if len(pairs) < _VECTORIZE_MIN_PAIRS:
+        return [_contrast_ratio(a, b) for a, b in pairs]
+    try:
+        import numpy as np
+    except Exception:
+        return [_contrast_ratio(a, b) for a, b in pairs]
+
+    parsed = [(_parse_hsl(a), _parse_hsl(b)) for a, b in pairs]
+    valid = [index for index, (a, b) in enumerate(parsed) if a and b]
+    results: list[float | None] = [None] * len(pairs)
+    if not valid:
+        return results
+    l1 = _batch_luminance(np, np.array([parsed[i][0] for i in valid], dtype=float))
+    l2 = _batch_luminance(np, np.array([parsed[i][1] for i in valid], dtype=float))
+    ratios = (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+    for index, ratio in zip(valid, ratios.tolist()):
+        results[index] = round(ratio, 2)
+    return results
+
+
+# Checked in order; the first keyword contained in the block type wins.
+_LAYOUT_KEYWORDS = (
+    ("Hero", "Hero"),
+    ("Footer", "Footer"),
+    ("Support", "Footer"),
+    ("LeadCapture", "CTA"),
+    ("Contact", "CTA"),
+    ("LogoCloud", "Proof"),
+    ("Testimonials", "Proof"),
+    ("CaseStudies", "Proof"),
+    ("Feature", "Features"),
+    ("UseCases", "Features"),
+    ("Integrations", "Features"),
+    ("Stats", "Features"),
+    ("Steps", "Features"),
+    ("Comparison", "Features"),
+    ("Pricing", "Features"),
+    ("FAQ", "Features"),
+)
+
+
+@lru_cache(maxsize=512)
+def _layout_label_for_type(block_type: str) -> str:
+    for keyword, label in _LAYOUT_KEYWORDS:
+        if keyword in block_type:
+            return label
+    return "Section"
+
+
+def _layout_label(section: dict) -> str:
+    label = section.get("layout_schema")
+    if isinstance(label, str) and label:
+        return label
+    return _layout_label_for_type(str(section.get("type", "")))
+
+
 def _infer_layout_schema(sections: list[dict]) -> list[str]:
-    labels: list[str] = []
-    for section in sections:
-        if not isinstance(section, dict):
-            continue
-        label = section.get("layout_schema")
-        if isinstance(label, str) and label:
-            labels.append(label)
-            continue
-        block_type = str(section.get("type", ""))
-        if "Hero" in block_type:
-            labels.append("Hero")
-        elif "Footer" in block_type or "Support" in block_type:
-            labels.append("Footer")
-        elif "LeadCapture" in block_type or "Contact" in block_type:
-            labels.append("CTA")
-        elif any(key in block_type for key in ["LogoCloud", "Testimonials", "CaseStudies"]):
-            labels.append("Proof")
-        elif any(
-            key in block_type
-            for key in [
-                "Feature",
-                "UseCases",
-                "Integrations",
-                "Stats",
-                "Steps",
-                "Comparison",
-                "Pricing",
-                "FAQ",
-            ]
-        ):
-            labels.append("Features")
+    return [_layout_label(section) for section in sections if isinstance(section, dict)]
+
+
+@lru_cache(maxsize=64)
+def _read_bytes_cached(path_str: str, mtime_ns: int) -> bytes:
+    return Path(path_str).read_bytes()
+
+
+def _dir_files(directory: Path) -> set[str]:
+    try:
+        return {entry.name for entry in os.scandir(directory)}
+    except OSError:
+        return set()
+
+
+def _load_json(path: Path):
+    # Only the immutable file bytes are shared across calls (until the file
+    # changes). Each call parses its own objects, because they end up in the
+    # returned report and callers may mutate it. Re-parsing with orjson is
+    # several times cheaper than deep-copying a cached parse.
+    data = _read_bytes_cached(str(path), path.stat().st_mtime_ns)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+PUCK_CONFIG_PATH = REPO_ROOT / "builder" / "src" / "puck" / "config.ts"
+# Written by `npm run puck:manifest` in builder/ (runs before `next build`).
+PUCK_MANIFEST_PATH = REPO_ROOT / "builder" / "dist" / "puck-components.json"
+
+_PUCK_CACHE: dict[tuple[str, int], tuple[frozenset[str], tuple[str, ...]]] = {}
+
+
+def _file_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_puck_blocks_from_config() -> frozenset[str]:
+    return _load_puck_blocks()[0]
+
+
+def _load_puck_blocks() -> tuple[frozenset[str], tuple[str, ...]]:
+    """Puck block names as a set for lookups plus the same names pre-sorted."""
+    config_mtime = _file_mtime_ns(PUCK_CONFIG_PATH)
+    manifest_mtime = _file_mtime_ns(PUCK_MANIFEST_PATH)
+    use_manifest = manifest_mtime is not None and (
+        config_mtime is None or manifest_mtime >= config_mtime
+    )
+    source_path = PUCK_MANIFEST_PATH if use_manifest else PUCK_CONFIG_PATH
+    source_mtime = manifest_mtime if use_manifest else config_mtime
+    if source_mtime is None:
+        return frozenset(), ()
+    key = (str(source_path), source_mtime)
+    cached = _PUCK_CACHE.get(key)
+    if cached is None:
+        content = source_path.read_text(encoding="utf-8")
+        if use_manifest:
+            names = _parse_puck_manifest(content)
         else:
-            labels.append("Section")
-    return labels
+            names = _parse_puck_components(content)
+        cached = (frozenset(names), tuple(sorted(names)))
+        _PUCK_CACHE.clear()
+        _PUCK_CACHE[key] = cached
+    return cached
 
 
-def _load_puck_blocks_from_config() -> set[str]:
-    config_path = REPO_ROOT / "builder" / "src" / "puck" / "config.ts"
-    if not config_path.exists():
+def _parse_puck_manifest(content: str) -> set[str]:
+    try:
+        payload = json.loads(content)
+    except json.JSONDecodeError:
         return set()
-    content = config_path.read_text(encoding="utf-8")
-    start = content.find("components")
-    if start == -1:
+    components = payload.get("components") if isinstance(payload, dict) else None
+    if not isinstance(components, list):
         return set()
-    brace_start = content.find("{", start)
-    if brace_start == -1:
+    return {f"{name}.v1" for name in components if isinstance(name, str) and name}
+
+
+def _parse_puck_components(content: str) -> set[str]:
+    match = _COMPONENTS_KEY_RE.search(content)
+    if not match:
         return set()
+    brace_start = match.end() - 1
     names: set[str] = set()
     depth = 0
-    for line in content[brace_start:].splitlines():
-        current_depth = depth
-        if current_depth == 1:
-            match = re.match(r"\s*([A-Za-z0-9]+)\s*:\s*\{", line)
-            if match:
-                names.add(f"{match.group(1)}.v1")
-        depth += line.count("{") - line.count("}")
-        if depth <= 0 and current_depth > 0:
-            break
+    for match in _COMPONENT_SCAN_RE.finditer(content, brace_start):
+        name = match.group(1)
+        if name is not None:
+            if depth == 1:
+                names.add(f"{name}.v1")
+            depth += 1
+        elif match.group() == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth <= 0:
+                break
     return names
 
 
 def _block_coverage(sections_path: Path) -> dict:
     if not sections_path.exists():
         return {"status": "missing", "reason": "sections_missing"}
-    data = json.loads(sections_path.read_text(encoding="utf-8"))
+    data = _load_json(sections_path)
     sections = data.get("sections", [])
     used_blocks = [
         section.get("type")
@@ -139,18 +295,22 @@ def _block_coverage(sections_path: Path) -> dict:
         if isinstance(section, dict) and isinstance(section.get("type"), str)
     ]
     used_set = {block for block in used_blocks if block}
-    puck_blocks = _load_puck_blocks_from_config()
+    mapped_blocks = sorted(used_set)
+    puck_blocks, puck_sorted = _load_puck_blocks()
     if not puck_blocks:
         return {
             "status": "skipped",
             "reason": "puck_config_missing",
-            "mapped_blocks": sorted(used_set),
+            "mapped_blocks": mapped_blocks,
             "sections": len(used_blocks),
         }
-    missing_in_puck = sorted(used_set - puck_blocks)
-    unused_puck = sorted(puck_blocks - used_set)
-    in_puck = used_set.intersection(puck_blocks)
-    coverage_ratio = round(len(in_puck) / len(used_set), 3) if used_set else 0.0
+    # used_set is typically a handful of blocks against hundreds in Puck, so
+    # probe from the small side and derive the overlap from the difference.
+    missing = used_set.difference(puck_blocks)
+    missing_in_puck = sorted(missing)
+    unused_puck = [block for block in puck_sorted if block not in used_set]
+    in_puck_count = len(used_set) - len(missing)
+    coverage_ratio = round(in_puck_count / len(used_set), 3) if used_set else 0.0
     candidates_missing: set[str] = set()
     for section in sections:
         if not isinstance(section, dict):
@@ -166,8 +326,8 @@ def _block_coverage(sections_path: Path) -> dict:
         "status": "ok" if not missing_in_puck else "missing",
         "coverage_ratio": coverage_ratio,
         "sections": len(used_blocks),
-        "mapped_blocks": sorted(used_set),
-        "puck_blocks": sorted(puck_blocks),
+        "mapped_blocks": mapped_blocks,
+        "puck_blocks": list(puck_sorted),
         "missing_in_puck": missing_in_puck,
         "unused_puck": unused_puck,
         "candidates_missing": sorted(candidates_missing),
@@ -175,7 +335,7 @@ def _block_coverage(sections_path: Path) -> dict:
 
 
 def _slugify(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    return _SLUG_RE.sub("-", value.lower()).strip("-")
 
 
 def _normalize_path(value: str) -> str:
@@ -185,8 +345,7 @@ def _normalize_path(value: str) -> str:
     return path.strip()
 
 
-def _collect_links(sections: list[dict]) -> list[dict]:
-    links: list[dict] = []
+def _collect_links(sections: list[dict]) -> Iterator[dict]:
     for section in sections:
         if not isinstance(section, dict):
             continue
@@ -195,57 +354,67 @@ def _collect_links(sections: list[dict]) -> list[dict]:
         section_id = props.get("id") or section.get("type") or "section"
         for button in content.get("buttons") or []:
             if isinstance(button, dict):
-                links.append(
-                    {
-                        "label": button.get("label") or "",
-                        "href": button.get("href") or "",
-                        "source": "content_button",
-                        "section_id": section_id,
-                    }
-                )
+                yield {
+                    "label": button.get("label") or "",
+                    "href": button.get("href") or "",
+                    "source": "content_button",
+                    "section_id": section_id,
+                }
         for link in content.get("links") or []:
             if isinstance(link, dict):
-                links.append(
-                    {
-                        "label": link.get("label") or "",
-                        "href": link.get("href") or "",
-                        "source": "content_link",
-                        "section_id": section_id,
-                    }
-                )
+                yield {
+                    "label": link.get("label") or "",
+                    "href": link.get("href") or "",
+                    "source": "content_link",
+                    "section_id": section_id,
+                }
         ctas = props.get("ctas")
         if isinstance(ctas, list):
             for cta in ctas:
                 if isinstance(cta, dict):
-                    links.append(
-                        {
-                            "label": cta.get("label") or "",
-                            "href": cta.get("href") or "",
-                            "source": "props_cta",
-                            "section_id": section_id,
-                        }
-                    )
+                    yield {
+                        "label": cta.get("label") or "",
+                        "href": cta.get("href") or "",
+                        "source": "props_cta",
+                        "section_id": section_id,
+                    }
         cta = props.get("cta")
         if isinstance(cta, dict):
-            links.append(
-                {
-                    "label": cta.get("label") or "",
-                    "href": cta.get("href") or "",
-                    "source": "props_cta",
-                    "section_id": section_id,
-                }
-            )
+            yield {
+                "label": cta.get("label") or "",
+                "href": cta.get("href") or "",
+                "source": "props_cta",
+                "section_id": section_id,
+            }
         for link in props.get("links") or []:
             if isinstance(link, dict):
-                links.append(
-                    {
-                        "label": link.get("label") or "",
-                        "href": link.get("href") or "",
-                        "source": "props_link",
-                        "section_id": section_id,
-                    }
-                )
-    return links
+                yield {
+                    "label": link.get("label") or "",
+                    "href": link.get("href") or "",
+                    "source": "props_link",
+                    "section_id": section_id,
+                }
+
+
+def _split_http_url(href: str) -> tuple[str, str]:
+    """Return (netloc, path) of an http(s) URL, slicing well-formed ones directly."""
+    start = href.find("://")
+    if start not in (4, 5) or any(ch in href for ch in ";[\t\r\n"):
+        parsed = urlparse(href)
+        return parsed.netloc, parsed.path
+    rest = href[start + 3 :]
+    end = len(rest)
+    for sep in "/?#":
+        index = rest.find(sep)
+        if index != -1 and index < end:
+            end = index
+    netloc = rest[:end]
+    path = rest[end:]
+    for sep in "?#":
+        index = path.find(sep)
+        if index != -1:
+            path = path[:index]
+    return netloc, path
 
 
 def _linker_report(sections_data: dict, site_plan: dict, domain: str) -> dict:
@@ -279,50 +448,56 @@ def _linker_report(sections_data: dict, site_plan: dict, domain: str) -> dict:
             if path:
                 routes.add(path)
                 routes.add(path.lstrip("/"))
-    links = _collect_links(sections)
+    # Every route spelling ("pricing", "/pricing", "/") collapses to one key.
+    known_routes = {route.lstrip("/") or "home" for route in routes}
     issues: list[dict] = []
     totals = {
-        "total": len(links),
+        "total": 0,
         "missing_href": 0,
         "invalid_anchor": 0,
         "unknown_route": 0,
         "invalid_href": 0,
     }
-    for link in links:
+    # _collect_links yields fresh dicts, so flagged links are tagged in place.
+    for link in _collect_links(sections):
+        totals["total"] += 1
         href = str(link.get("href") or "").strip()
         if not href:
             totals["missing_href"] += 1
-            issues.append({**link, "issue": "missing_href"})
+            link["issue"] = "missing_href"
+            issues.append(link)
             continue
         if href in {"#", "/#"} or href.startswith("javascript:"):
             totals["invalid_href"] += 1
-            issues.append({**link, "issue": "invalid_href"})
+            link["issue"] = "invalid_href"
+            issues.append(link)
             continue
-        if href.startswith(("mailto:", "tel:", "sms:")):
+        if href.startswith(_CONTACT_SCHEMES):
             continue
         if href.startswith("#"):
             anchor = href[1:]
             if anchor not in anchors:
                 totals["invalid_anchor"] += 1
-                issues.append({**link, "issue": "invalid_anchor"})
+                link["issue"] = "invalid_anchor"
+                issues.append(link)
             continue
-        parsed = urlparse(href)
-        if parsed.scheme in {"http", "https"}:
-            if parsed.netloc and parsed.netloc != domain and not parsed.netloc.endswith(domain):
+        if href[:6].lower().startswith(_HTTP_SCHEMES):
+            netloc, url_path = _split_http_url(href)
+            if netloc and netloc != domain and not netloc.endswith(domain):
                 continue
-            path = _normalize_path(parsed.path)
+            path = _normalize_path(url_path)
             if not path:
                 continue
-            normalized = path.lstrip("/") or "home"
-            if routes and normalized not in routes and f"/{normalized}" not in routes and path not in routes:
+            if known_routes and (path.lstrip("/") or "home") not in known_routes:
                 totals["unknown_route"] += 1
-                issues.append({**link, "issue": "unknown_route"})
+                link["issue"] = "unknown_route"
+                issues.append(link)
             continue
         path = _normalize_path(href)
-        normalized = path.lstrip("/") or "home"
-        if routes and normalized not in routes and f"/{normalized}" not in routes and path not in routes:
+        if known_routes and (path.lstrip("/") or "home") not in known_routes:
             totals["unknown_route"] += 1
-            issues.append({**link, "issue": "unknown_route"})
+            link["issue"] = "unknown_route"
+            issues.append(link)
     status = "ok" if not issues else "issues"
     return {
         "status": status,
@@ -333,75 +508,28 @@ def _linker_report(sections_data: dict, site_plan: dict, domain: str) -> dict:
     }
 
 
-def _structure_score(sections: list[dict], layout_schema: list[str]) -> float:
+def _compute_all_scores(sections: list[dict], layout_schema: list[str]) -> dict:
+    """Structure, adaptability, intent-tag and reusability scores in one pass."""
     if not sections:
-        return 0.0
-    labels = layout_schema or _infer_layout_schema(sections)
-    present = set(labels)
-    required = ["Hero", "Features", "CTA", "Footer"]
-    features_present = any(label in {"Features", "Proof", "Pricing", "FAQ"} for label in present)
-    coverage = 0
-    for req in required:
-        if req == "Features":
-            coverage += 1 if features_present else 0
-        else:
-            coverage += 1 if req in present else 0
-    base = coverage / len(required)
-    total = len(sections)
-    bonus = 0.05 if 4 <= total <= 12 else 0.0
-    return min(1.0, round(base + bonus, 3))
-
-
-def _adaptability_score(sections: list[dict]) -> float:
-    if not sections:
-        return 0.0
-    scored = 0
-    overflow = 0
-    for section in sections:
-        if not isinstance(section, dict):
-            continue
-        constraints = section.get("content_constraints") or {}
-        if isinstance(constraints, dict) and constraints:
-            scored += 1
-        tolerance = section.get("tolerance") or {}
-        if isinstance(tolerance, dict) and tolerance.get("overflow_risk"):
-            overflow += 1
-    base = scored / len(sections)
-    penalty = 0.1 * (overflow / len(sections))
-    return max(0.0, round(base - penalty, 3))
-
-
-def _intent_tag_score(sections: list[dict]) -> float:
-    if not sections:
-        return 0.0
+        return {
+            "structure_score": 0.0,
+            "adaptability_score": 0.0,
+            "intent_tag_score": 0.0,
+            "reusability_score": 0.0,
+        }
+    inferred: list[str] = []
     tags: set[str] = set()
-    for section in sections:
-        intent_tags = section.get("intent_tags")
-        if isinstance(intent_tags, list):
-            tags.update([tag for tag in intent_tags if isinstance(tag, str)])
-        intent = section.get("intent")
-        if isinstance(intent, str) and intent:
-            tags.add(intent)
-    if not tags:
-        return 0.0
-    required = ["product_story", "feature_explain", "conversion", "trust"]
-    coverage = sum(1 for tag in required if tag in tags) / len(required)
-    diversity = min(1.0, len(tags) / 6)
-    score = 0.7 * coverage + 0.3 * diversity
-    return min(1.0, round(score, 3))
-
-
-def _reusability_score(sections: list[dict]) -> float:
-    if not sections:
-        return 0.0
     constraints = 0
     overflow = 0
     dynamic_height = 0
     cta_heavy = 0
     for section in sections:
-        if isinstance(section.get("content_constraints"), dict) and section.get(
-            "content_constraints"
-        ):
+        if not isinstance(section, dict):
+            continue
+        if not layout_schema:
+            inferred.append(_layout_label(section))
+        content_constraints = section.get("content_constraints")
+        if isinstance(content_constraints, dict) and content_constraints:
             constraints += 1
         tolerance = section.get("tolerance") or {}
         if isinstance(tolerance, dict):
@@ -411,14 +539,48 @@ def _reusability_score(sections: list[dict]) -> float:
                 dynamic_height += 1
             if tolerance.get("cta_heavy"):
                 cta_heavy += 1
-    base = constraints / len(sections)
+        intent_tags = section.get("intent_tags")
+        if isinstance(intent_tags, list):
+            tags.update([tag for tag in intent_tags if isinstance(tag, str)])
+        intent = section.get("intent")
+        if isinstance(intent, str) and intent:
+            tags.add(intent)
+    total = len(sections)
+    size_bonus = 0.05 if 4 <= total <= 12 else 0.0
+
+    present = set(layout_schema or inferred)
+    features_present = any(label in {"Features", "Proof", "Pricing", "FAQ"} for label in present)
+    required_labels = ["Hero", "Features", "CTA", "Footer"]
+    coverage = sum(
+        1
+        for req in required_labels
+        if (features_present if req == "Features" else req in present)
+    )
+    structure_score = min(1.0, round(coverage / len(required_labels) + size_bonus, 3))
+
+    adaptability_score = max(0.0, round(constraints / total - 0.1 * (overflow / total), 3))
+
+    if tags:
+        required_tags = ["product_story", "feature_explain", "conversion", "trust"]
+        tag_coverage = sum(1 for tag in required_tags if tag in tags) / len(required_tags)
+        diversity = min(1.0, len(tags) / 6)
+        intent_tag_score = min(1.0, round(0.7 * tag_coverage + 0.3 * diversity, 3))
+    else:
+        intent_tag_score = 0.0
+
     penalty = (
-        0.15 * (overflow / len(sections))
-        + 0.1 * (dynamic_height / len(sections))
-        + 0.1 * (cta_heavy / len(sections))
+        0.15 * (overflow / total)
+        + 0.1 * (dynamic_height / total)
+        + 0.1 * (cta_heavy / total)
     )
-    bonus = 0.05 if 4 <= len(sections) <= 12 else 0.0
-    return max(0.0, min(1.0, round(base - penalty + bonus, 3)))
+    reusability_score = max(0.0, min(1.0, round(constraints / total - penalty + size_bonus, 3)))
+
+    return {
+        "structure_score": structure_score,
+        "adaptability_score": adaptability_score,
+        "intent_tag_score": intent_tag_score,
+        "reusability_score": reusability_score,
+    }
 
 
 def _style_transfer_score(tokens: dict) -> float:
@@ -442,8 +604,24 @@ def _similarity_score(diff_payload: dict | None) -> float | None:
     return round(max(0.0, 1.0 - float(mismatch_percent)), 3)
 
 
+def _write_report(report_path: Path, report: dict, pretty: bool = True) -> None:
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        report_path.write_bytes(orjson.dumps(report, option=option))
+        return
+    with report_path.open("w", encoding="utf-8") as handle:
+        if pretty:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+        else:
+            json.dump(report, handle, ensure_ascii=False, separators=(",", ":"))
+
+
 def verify_outputs(
-    domain: str, output_root: Path, page_slug: str | None = None
+    domain: str,
+    output_root: Path,
+    page_slug: str | None = None,
+    pretty: bool = True,
 ) -> dict:
     site_dir = output_root / domain
     page_slug = page_slug or "home"
@@ -472,16 +650,19 @@ def verify_outputs(
         "classification": {},
     }
 
+    # One directory listing per parent instead of one stat() per file.
+    dir_files: dict[Path, set[str]] = {}
     for key, path in report["files"].items():
-        report["status"][key] = Path(path).exists()
+        file_path = Path(path)
+        if file_path.parent not in dir_files:
+            dir_files[file_path.parent] = _dir_files(file_path.parent)
+        report["status"][key] = file_path.name in dir_files[file_path.parent]
 
-    base = Path(report["files"]["screenshot"])
     visual_reports: dict[str, dict] = {}
     visual_similarities: list[float] = []
     for viewport in ["desktop", "mobile"]:
-        report_path = VISUAL_QA_OUT / domain / "visual-qa" / viewport / "report.json"
-        if report_path.exists():
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
+        if report["status"][f"visual_qa_{viewport}"]:
+            payload = _load_json(Path(report["files"][f"visual_qa_{viewport}"]))
             visual_reports[viewport] = payload
             similarity = payload.get("similarity")
             if isinstance(similarity, (int, float)):
@@ -514,8 +695,8 @@ def verify_outputs(
     sections_data = {}
     sections_list: list[dict] = []
     layout_schema: list[str] = []
-    if sections_path.exists():
-        sections_data = json.loads(sections_path.read_text(encoding="utf-8"))
+    if report["status"]["sections"]:
+        sections_data = _load_json(sections_path)
         sections_list = sections_data.get("sections", [])
         sections_count = len(sections_list)
         layout_schema = sections_data.get("layout_schema", []) or []
@@ -523,15 +704,15 @@ def verify_outputs(
         sections_count = 0
     site_plan_path = site_dir / "site_plan.json"
     site_plan = {}
-    if site_plan_path.exists():
-        site_plan = json.loads(site_plan_path.read_text(encoding="utf-8"))
-    extract_path = site_dir / "extract" / "extract.json"
-    extract_data = {}
-    if extract_path.exists():
-        extract_data = json.loads(extract_path.read_text(encoding="utf-8"))
-    content_assets = sections_data.get("content_assets") or extract_data.get(
-        "content_assets"
-    ) or {}
+    if site_plan_path.is_file():
+        site_plan = _load_json(site_plan_path)
+    # extract.json is only a fallback source, so it is read only when needed.
+    content_assets = sections_data.get("content_assets")
+    if not content_assets:
+        extract_path = site_dir / "extract" / "extract.json"
+        if extract_path.exists():
+            content_assets = _load_json(extract_path).get("content_assets")
+    content_assets = content_assets or {}
 
     report["classification"] = {
         "structure": {
@@ -539,11 +720,11 @@ def verify_outputs(
             "status": "ok" if sections_count > 0 else "missing",
         },
         "tokens": {
-            "status": "ok" if Path(report["files"]["tokens"]).exists() else "missing",
+            "status": "ok" if report["status"]["tokens"] else "missing",
         },
         "assets": {
             "status": "ok"
-            if Path(report["files"]["screenshot"]).exists()
+            if report["status"]["screenshot"]
             else "missing"
         },
     }
@@ -554,14 +735,14 @@ def verify_outputs(
     report["content_assets"] = content_assets
 
     tokens_path = Path(report["files"]["tokens"])
-    if tokens_path.exists():
-        tokens = json.loads(tokens_path.read_text(encoding="utf-8"))
+    tokens = {}
+    if report["status"]["tokens"]:
+        tokens = _load_json(tokens_path)
         colors = tokens.get("colors", {})
         bg = colors.get("background")
         fg = colors.get("foreground")
         primary = colors.get("primary")
-        bg_fg = _contrast_ratio(bg, fg) if bg and fg else None
-        bg_primary = _contrast_ratio(bg, primary) if bg and primary else None
+        bg_fg, bg_primary = _batch_contrast_ratio([(bg, fg), (bg, primary)])
         report["aesthetics"] = {
             "contrast": {
                 "bg_fg": bg_fg,
@@ -573,11 +754,12 @@ def verify_outputs(
         }
 
     similarity = _similarity_score(report["visual_regression"].get("result"))
-    structure_score = _structure_score(sections_list, layout_schema)
-    adaptability_score = _adaptability_score(sections_list)
-    intent_tag_score = _intent_tag_score(sections_list)
-    reusability_score = _reusability_score(sections_list)
-    style_transfer = _style_transfer_score(tokens if tokens_path.exists() else {})
+    scores = _compute_all_scores(sections_list, layout_schema)
+    structure_score = scores["structure_score"]
+    adaptability_score = scores["adaptability_score"]
+    intent_tag_score = scores["intent_tag_score"]
+    reusability_score = scores["reusability_score"]
+    style_transfer = _style_transfer_score(tokens)
     thresholds = {
         "similarity": 0.75,
         "structure_score": 0.8,
@@ -615,15 +797,38 @@ def verify_outputs(
         else "fail",
     }
 
-    report_path = site_dir / "reports" / f"{page_slug}.json"
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(
-        json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    _write_report(site_dir / "reports" / f"{page_slug}.json", report, pretty=pretty)
 
     return report
 
 
+def _warm_worker() -> None:
+    _load_puck_blocks_from_config()
+
+
+def _verify_job(job: tuple[str, Path, str | None]) -> dict:
+    domain, output_root, page_slug = job
+    return verify_outputs(domain, output_root, page_slug=page_slug)
+
+
+def verify_many(
+    jobs: list[tuple[str, Path, str | None]], max_workers: int | None = None
+) -> list[dict]:
+    """Run verify_outputs for (domain, output_root, page_slug) jobs in parallel.
+
+    Each job writes its own reports/{page_slug}.json, so workers never share files.
+    """
+    if not jobs:
+        return []
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_verify_job(job) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as executor:
+        return list(executor.map(_verify_job, jobs))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Verify asset-factory outputs")
     parser.add_argument("--domain", required=True, help="Site domain key")
@@ -633,9 +838,14 @@ def main() -> None:
         help="Asset-factory output root",
     )
     parser.add_argument("--page", default="home", help="Page slug")
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent the written report JSON"
+    )
     args = parser.parse_args()
 
-    report = verify_outputs(args.domain, Path(args.output), page_slug=args.page)
+    report = verify_outputs(
+        args.domain, Path(args.output), page_slug=args.page, pretty=args.pretty
+    )
     report_path = (
         Path(args.output) / args.domain / "reports" / f"{args.page}.json"
     )
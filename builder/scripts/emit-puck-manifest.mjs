@@ -0,0 +1,43 @@
+#!/usr/bin/env node
+
+import fs from "node:fs/promises";
+import path from "node:path";
+import process from "node:process";
+import ts from "typescript";
+
+const ROOT = process.cwd();
+const CONFIG_FILE = path.join(ROOT, "src", "puck", "config.ts");
+const OUT_FILE = path.join(ROOT, "dist", "puck-components.json");
+
+const propertyName = (node) => {
+  if (!node.name) return "";
+  if (ts.isIdentifier(node.name) || ts.isStringLiteral(node.name)) return node.name.text;
+  return "";
+};
+
+const findComponents = (node) => {
+  if (ts.isPropertyAssignment(node) && propertyName(node) === "components") {
+    if (ts.isObjectLiteralExpression(node.initializer)) {
+      return node.initializer.properties.map(propertyName).filter(Boolean);
+    }
+  }
+  let found = null;
+  ts.forEachChild(node, (child) => {
+    if (!found) found = findComponents(child);
+  });
+  return found;
+};
+
+const main = async () => {
+  const source = await fs.readFile(CONFIG_FILE, "utf8");
+  const sourceFile = ts.createSourceFile(CONFIG_FILE, source, ts.ScriptTarget.Latest, true);
+  const components = findComponents(sourceFile) || [];
+  await fs.mkdir(path.dirname(OUT_FILE), { recursive: true });
+  await fs.writeFile(OUT_FILE, `${JSON.stringify({ components }, null, 2)}\n`, "utf8");
+  console.log(`Wrote ${components.length} components to ${path.relative(ROOT, OUT_FILE)}`);
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
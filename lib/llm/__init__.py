@@ -15,6 +15,7 @@ Usage:
     )
 """
 
+from .cache import LLMCache
 from .client import (
     OpenRouterClient,
     TemplateReconstructor,
@@ -28,6 +29,7 @@ from .batch_processor import (
 )
 
 __all__ = [
+    "LLMCache",
     "OpenRouterClient",
     "TemplateReconstructor",
     "create_llm_client",
@@ -0,0 +1,195 @@
+"""
+Anthropic Message Batches support for bulk template generation.
+
+OpenRouter has no batch endpoint, so batched runs go straight to Anthropic
+for `anthropic/*` models (mapped to Anthropic ids in ANTHROPIC_MODELS): all
+requests are uploaded at once and the results are collected after a single
+polling loop, at roughly half the per-request price of interactive calls.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import httpx
+
+from .client import image_base64
+
+ANTHROPIC_BATCHES_URL = "https://api.anthropic.com/v1/messages/batches"
+ANTHROPIC_VERSION = "2023-06-01"
+# Batches expire after 24 hours; wait a little longer for the final status.
+BATCH_TIMEOUT = 25 * 60 * 60
+# Consecutive transient failures (network, 429, 5xx) tolerated while polling.
+POLL_RETRIES = 5
+
+
+# OpenRouter model id -> Anthropic API model id. OpenRouter ids are not
+# valid Anthropic ids (dots vs dashes, dated suffixes), so only mapped models
+# can be batched; ANTHROPIC_BATCH_MODEL overrides the mapping.
+ANTHROPIC_MODELS = {
+    "anthropic/claude-sonnet-4-5-2025-06-01": "claude-sonnet-4-5",
+    "anthropic/claude-sonnet-4.5": "claude-sonnet-4-5",
+    "anthropic/claude-sonnet-4": "claude-sonnet-4-20250514",
+    "anthropic/claude-opus-4.1": "claude-opus-4-1-20250805",
+    "anthropic/claude-opus-4": "claude-opus-4-20250514",
+    "anthropic/claude-3.7-sonnet": "claude-3-7-sonnet-20250219",
+    "anthropic/claude-3.5-haiku": "claude-3-5-haiku-20241022",
+}
+
+
+def supports_batching(model: str) -> bool:
+    """Whether `model` (an OpenRouter model id) can run through the batch API.
+
+    Unmapped models without an ANTHROPIC_BATCH_MODEL override are not
+    batchable, so callers fall back to interactive calls for them.
+    """
+    return (
+        model.startswith("anthropic/")
+        and bool(os.getenv("ANTHROPIC_API_KEY"))
+        and (model in ANTHROPIC_MODELS or bool(os.getenv("ANTHROPIC_BATCH_MODEL")))
+    )
+
+
+def anthropic_model(model: str) -> str:
+    """Anthropic API model id for the OpenRouter id `model`."""
+    override = os.getenv("ANTHROPIC_BATCH_MODEL")
+    if override:
+        return override
+    try:
+        return ANTHROPIC_MODELS[model]
+    except KeyError:
+        raise ValueError(
+            f"No Anthropic model id known for {model!r}; add it to "
+            "ANTHROPIC_MODELS or set ANTHROPIC_BATCH_MODEL"
+        ) from None
+
+
+def as_chat_completion(text: str) -> dict:
+    """Wrap batch output in the OpenRouter response shape LLMCache stores."""
+    return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+
+def _headers(api_key: str | None) -> dict:
+    key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    if not key:
+        raise ValueError("ANTHROPIC_API_KEY not set")
+    return {
+        "x-api-key": key,
+        "anthropic-version": ANTHROPIC_VERSION,
+        "content-type": "application/json",
+    }
+
+
+def build_request(
+    custom_id: str,
+    model: str,
+    prompt: str,
+    max_tokens: int = 4000,
+    image_path: str | Path | None = None,
+    temperature: float = 0.2,
+) -> dict:
+    """Build one Message Batches request entry for an Anthropic model id.
+
+    temperature defaults to the 0.2 the interactive client samples with.
+    """
+    content: list[dict] = [{"type": "text", "text": prompt}]
+    if image_path is not None:
+        image_data = image_base64(image_path)
+        content.insert(
+            0,
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/png",
+                    "data": image_data,
+                },
+            },
+        )
+    return {
+        "custom_id": custom_id,
+        "params": {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+        },
+    }
+
+
+def submit_batch(requests: list[dict], api_key: str | None = None) -> str:
+    """Submit a list of batch requests and return the batch id."""
+    with httpx.Client(timeout=300.0) as client:
+        response = client.post(
+            ANTHROPIC_BATCHES_URL,
+            headers=_headers(api_key),
+            json={"requests": requests},
+        )
+        response.raise_for_status()
+        return response.json()["id"]
+
+
+def _is_transient(error: httpx.HTTPError) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def await_batch(
+    batch_id: str,
+    api_key: str | None = None,
+    poll_interval: float = 30.0,
+    timeout: float | None = None,
+) -> dict[str, dict]:
+    """Poll until the batch ends, then return results keyed by custom_id.
+
+    Each value is either {"text": ...} for a succeeded request or
+    {"error": ...} describing why it did not complete. Up to POLL_RETRIES
+    consecutive transient poll failures are retried; anything else raises.
+    """
+    headers = _headers(api_key)
+    deadline = time.monotonic() + timeout if timeout else None
+    failures = 0
+    with httpx.Client(timeout=120.0) as client:
+        while True:
+            try:
+                response = client.get(
+                    f"{ANTHROPIC_BATCHES_URL}/{batch_id}", headers=headers
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                if not _is_transient(e) or failures >= POLL_RETRIES:
+                    raise
+                failures += 1
+                time.sleep(poll_interval)
+                continue
+            failures = 0
+            batch = response.json()
+            if batch.get("processing_status") == "ended":
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Batch {batch_id} did not finish in {timeout}s")
+            time.sleep(poll_interval)
+
+        results: dict[str, dict] = {}
+        with client.stream("GET", batch["results_url"], headers=headers) as stream:
+            stream.raise_for_status()
+            for line in stream.iter_lines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                result = entry.get("result") or {}
+                if result.get("type") == "succeeded":
+                    blocks = result.get("message", {}).get("content", [])
+                    text = "".join(
+                        block.get("text", "")
+                        for block in blocks
+                        if block.get("type") == "text"
+                    )
+                    results[entry["custom_id"]] = {"text": text}
+                else:
+                    error = result.get("error") or result.get("type") or "unknown"
+                    results[entry["custom_id"]] = {"error": str(error)}
+        return results
@@ -2,20 +2,45 @@
 Batch processor for template reconstruction from screenshots.
 """
 
+import asyncio
+import functools
 import json
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .client import OpenRouterClient, TemplateReconstructor
-from .prompts import (
-    TEMPLATE_RECONSTRUCTION_SYSTEM,
-    TEMPLATE_GENERATION_PROMPT,
-    VISION_ANALYSIS_PROMPT,
+import httpx
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+from . import batch_api
+from .cache import LLMCache
+from .client import (
+    OpenRouterClient,
+    TemplateReconstructor,
+    _HTTP2,
+    _dumps,
+    _loads,
+    image_base64,
 )
 
 
+def _dump_json(data: Any, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 class BatchTemplateProcessor:
     """Process multiple websites to generate templates from screenshots."""
 
@@ -29,6 +54,7 @@ class BatchTemplateProcessor:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.results: list[dict] = []
+        self._status_counts: Counter[str] = Counter()
 
     def load_snapshots(self, snapshot_index: str | Path) -> list[dict]:
         """Load snapshot index file."""
@@ -49,58 +75,334 @@ class BatchTemplateProcessor:
             template = self.reconstructor.reconstruct_from_screenshot(
                 screenshot_path, dom_path, site_name
             )
-            template["domain"] = domain
-            template["generated_at"] = datetime.now().isoformat()
+            return self._save_template(template, domain)
 
-            # Save individual template
-            output_path = self.output_dir / f"{domain}.json"
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(template, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            return self._error_result(domain, e)
+
+    def _load_site_inputs(self, snapshot: dict) -> dict:
+        """Parse a site's DOM snapshot and pre-encode its screenshot."""
+        dom_snapshot = _loads(Path(snapshot["snapshot"]).read_bytes())
+        image_base64(snapshot["screenshot"])
+        return dom_snapshot
 
-            print(f"  ✓ Saved: {output_path.name}")
-            return {"status": "success", "domain": domain, "template": template}
+    async def _produce_inputs(
+        self, snapshots: list[dict], queue: asyncio.Queue, workers: int
+    ) -> None:
+        """Read site inputs off the event loop, ahead of the workers."""
+        for index, snapshot in enumerate(snapshots):
+            try:
+                loaded = await asyncio.to_thread(self._load_site_inputs, snapshot)
+            except Exception as e:
+                loaded = e
+            await queue.put((index, loaded))
+        for _ in range(workers):
+            await queue.put(None)
 
+    async def _avisual_worker(
+        self,
+        snapshots: list[dict],
+        queue: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+        results: list[dict | None],
+        template_tasks: dict[int, asyncio.Task],
+    ) -> None:
+        """Pipeline stage 1: run the vision call, then hand off to stage 2."""
+        while (entry := await queue.get()) is not None:
+            index, dom_snapshot = entry
+            snapshot = snapshots[index]
+            domain = snapshot["domain"]
+            if isinstance(dom_snapshot, Exception):
+                results[index] = self._error_result(domain, dom_snapshot)
+                continue
+            print(f"Processing {domain}...")
+            try:
+                async with semaphore:
+                    visual_spec = await self.reconstructor.aanalyze_screenshot(
+                        snapshot["screenshot"], domain
+                    )
+            except Exception as e:
+                results[index] = self._error_result(domain, e)
+                continue
+            template_tasks[index] = asyncio.create_task(
+                self._atemplate(snapshot, dom_snapshot, visual_spec, semaphore)
+            )
+
+    async def _atemplate(
+        self,
+        snapshot: dict,
+        dom_snapshot: dict,
+        visual_spec: dict,
+        semaphore: asyncio.Semaphore,
+    ) -> dict:
+        """Pipeline stage 2: generate and save the template."""
+        domain = snapshot["domain"]
+        try:
+            async with semaphore:
+                template = await self.reconstructor.agenerate_template(
+                    dom_snapshot, visual_spec, domain
+                )
+            # Keep the serialize + write off the event loop so it does not
+            # stall the other in-flight requests.
+            return await asyncio.to_thread(self._save_template, template, domain)
         except Exception as e:
-            print(f"  ✗ Failed: {e}")
-            return {
-                "status": "error",
-                "domain": domain,
-                "error": str(e),
-            }
+            return self._error_result(domain, e)
+
+    def _save_template(self, template: dict, domain: str) -> dict:
+        template["domain"] = domain
+        template["generated_at"] = datetime.now().isoformat()
+
+        # Save individual template
+        output_path = self.output_dir / f"{domain}.json"
+        _dump_json(template, output_path)
+
+        print(f"  ✓ Saved: {output_path.name}")
+        return {"status": "success", "domain": domain, "template": template}
+
+    @staticmethod
+    def _error_result(domain: str, error: Exception) -> dict:
+        print(f"  ✗ Failed ({domain}): {error}")
+        return {
+            "status": "error",
+            "domain": domain,
+            "error": str(error),
+        }
 
     def process_all(
         self,
         snapshot_index: str | Path,
         limit: int | None = None,
+        concurrency: int = 8,
+        use_batch_api: bool = False,
     ) -> dict:
-        """Process all sites from snapshot index."""
+        """Process all sites from snapshot index.
+
+        With use_batch_api, anthropic/* models go through the Message Batches
+        API; other models fall back to concurrent interactive calls.
+
+        Synchronous only: it runs its own event loop, so code that already
+        runs one (async callers, notebooks) must await aprocess_all() instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "process_all() cannot run inside a running event loop; "
+                "await aprocess_all() instead"
+            )
+        try:
+            if use_batch_api and batch_api.supports_batching(self.llm.model):
+                return self.process_all_batched(snapshot_index, limit)
+            return asyncio.run(self.aprocess_all(snapshot_index, limit, concurrency))
+        finally:
+            self.llm.close()
+
+    def process_all_batched(
+        self,
+        snapshot_index: str | Path,
+        limit: int | None = None,
+    ) -> dict:
+        """Run both reconstruction steps for every site as two provider batches."""
+        snapshots = self.load_snapshots(snapshot_index)
+        if limit:
+            snapshots = snapshots[:limit]
+
+        print(f"Processing {len(snapshots)} sites via batch API...")
+
+        model = batch_api.anthropic_model(self.llm.model)
+        results: dict[int, dict] = {}
+        dom_snapshots: dict[int, dict] = {}
+        vision_jobs: dict[int, tuple] = {}
+        for index, snapshot in enumerate(snapshots):
+            try:
+                dom_snapshots[index] = _loads(Path(snapshot["snapshot"]).read_bytes())
+                prompt = self.reconstructor.build_vision_prompt(snapshot["domain"])
+                vision_jobs[index] = (
+                    self.llm._image_key(snapshot["screenshot"], prompt, 4000),
+                    functools.partial(
+                        batch_api.build_request,
+                        f"site-{index}",
+                        model,
+                        prompt,
+                        max_tokens=4000,
+                        image_path=snapshot["screenshot"],
+                    ),
+                )
+            except Exception as e:
+                results[index] = self._error_result(snapshot["domain"], e)
+
+        # Step 1: visual analysis for every site in one batch
+        visual_specs: dict[int, dict] = {}
+        for index, outcome in self._run_batch(vision_jobs).items():
+            if "text" in outcome:
+                visual_specs[index] = self.reconstructor._extract_json(
+                    outcome["text"], "visual_spec"
+                )
+            else:
+                results[index] = self._error_result(
+                    snapshots[index]["domain"], RuntimeError(outcome["error"])
+                )
+
+        # Step 2: template generation for every site that got a visual spec
+        template_jobs: dict[int, tuple] = {}
+        for index, visual_spec in visual_specs.items():
+            try:
+                prompt = self.reconstructor.build_structured_prompt(
+                    dom_snapshots[index], visual_spec
+                )
+                template_jobs[index] = (
+                    self.llm._messages_key(
+                        [{"role": "user", "content": prompt}], 6000, 0.2
+                    ),
+                    functools.partial(
+                        batch_api.build_request,
+                        f"site-{index}",
+                        model,
+                        prompt,
+                        max_tokens=6000,
+                    ),
+                )
+            except Exception as e:
+                results[index] = self._error_result(snapshots[index]["domain"], e)
+
+        for index, outcome in self._run_batch(template_jobs).items():
+            domain = snapshots[index]["domain"]
+            try:
+                if "text" not in outcome:
+                    raise RuntimeError(outcome["error"])
+                template = self.reconstructor._finish_template(
+                    outcome["text"], domain, visual_specs[index]
+                )
+                results[index] = self._save_template(template, domain)
+            except Exception as e:
+                results[index] = self._error_result(domain, e)
+
+        self._record(results[index] for index in sorted(results))
+        return self._write_summary()
+
+    def _run_batch(self, jobs: dict[int, tuple]) -> dict[int, dict]:
+        """Resolve {index: (cache_key, build_request)} to batch outcomes.
+
+        Uses the same cache keys as the interactive calls: hits are served
+        without building a request, and fresh successes are stored in the
+        response shape call()/acall() read back. Outcomes are {"text": ...}
+        or {"error": ...}.
+        """
+        outcomes: dict[int, dict] = {}
+        pending: dict[int, tuple[str | None, dict]] = {}
+        for index, (cache_key, build_request) in jobs.items():
+            cached = self.llm._cached(cache_key)
+            if cached is not None:
+                outcomes[index] = {"text": cached["choices"][0]["message"]["content"]}
+                continue
+            try:
+                pending[index] = (cache_key, build_request())
+            except Exception as e:
+                outcomes[index] = {"error": str(e)}
+        if not pending:
+            return outcomes
+        batch_id = None
+        try:
+            batch_id = batch_api.submit_batch(
+                [request for _, request in pending.values()]
+            )
+            self._log_batch(batch_id, len(pending))
+            batch_results = batch_api.await_batch(
+                batch_id, timeout=batch_api.BATCH_TIMEOUT
+            )
+        except (httpx.HTTPError, TimeoutError) as e:
+            # Keep the run alive so the summary is still written; the logged
+            # batch id lets a paid batch be collected later.
+            error = f"batch {batch_id}: {e}" if batch_id else f"batch submit: {e}"
+            for index in pending:
+                outcomes[index] = {"error": error}
+            return outcomes
+        for index, (cache_key, request) in pending.items():
+            outcome = batch_results.get(request["custom_id"], {"error": "missing"})
+            if "text" in outcome and cache_key is not None:
+                self.llm.cache.put(
+                    cache_key, batch_api.as_chat_completion(outcome["text"])
+                )
+            outcomes[index] = outcome
+        return outcomes
+
+    def _log_batch(self, batch_id: str, request_count: int) -> None:
+        """Print and append a submitted batch id to output_dir/batches.jsonl."""
+        print(f"  Submitted batch {batch_id} ({request_count} requests)")
+        entry = {
+            "batch_id": batch_id,
+            "requests": request_count,
+            "submitted_at": datetime.now().isoformat(),
+        }
+        with (self.output_dir / "batches.jsonl").open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    async def aprocess_all(
+        self,
+        snapshot_index: str | Path,
+        limit: int | None = None,
+        concurrency: int = 8,
+    ) -> dict:
+        """Process all sites concurrently, at most `concurrency` at a time."""
         snapshots = self.load_snapshots(snapshot_index)
         if limit:
             snapshots = snapshots[:limit]
 
         print(f"Processing {len(snapshots)} sites...")
 
-        for snapshot in snapshots:
-            result = self.process_site(
-                screenshot_path=snapshot["screenshot"],
-                dom_path=snapshot["snapshot"],
-                site_name=snapshot["domain"],
-                domain=snapshot["domain"],
+        # The semaphore bounds in-flight LLM calls, not sites: each site's
+        # template call is scheduled as soon as its own vision call returns,
+        # so the two stages overlap instead of waiting on the slowest site.
+        # Inputs for the next `workers` sites are read and parsed in a
+        # thread meanwhile, so disk IO hides behind network latency.
+        workers = max(1, concurrency)
+        semaphore = asyncio.Semaphore(workers)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+        results: list[dict | None] = [None] * len(snapshots)
+        template_tasks: dict[int, asyncio.Task] = {}
+        try:
+            await asyncio.gather(
+                self._produce_inputs(snapshots, queue, workers),
+                *(
+                    self._avisual_worker(
+                        snapshots, queue, semaphore, results, template_tasks
+                    )
+                    for _ in range(workers)
+                ),
             )
-            self.results.append(result)
+            outcomes = await asyncio.gather(
+                *template_tasks.values(), return_exceptions=True
+            )
+        finally:
+            await self.llm.aclose()
+        for index, outcome in zip(template_tasks, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = self._error_result(snapshots[index]["domain"], outcome)
+            results[index] = outcome
+        self._record(results)
+
+        return await asyncio.to_thread(self._write_summary)
 
-        # Save summary report
+    def _record(self, outcomes) -> None:
+        """Append outcomes, tallying statuses as they arrive."""
+        for outcome in outcomes:
+            self.results.append(outcome)
+            self._status_counts[outcome["status"]] += 1
+
+    def _write_summary(self) -> dict:
+        """Save the summary report for everything in self.results."""
         summary = {
             "processed_at": datetime.now().isoformat(),
             "total": len(self.results),
-            "successful": sum(1 for r in self.results if r["status"] == "success"),
-            "failed": sum(1 for r in self.results if r["status"] == "error"),
+            "successful": self._status_counts["success"],
+            "failed": self._status_counts["error"],
             "results": self.results,
         }
 
         summary_path = self.output_dir / "batch_summary.json"
-        with summary_path.open("w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        _dump_json(summary, summary_path)
 
         print(
             f"\nBatch complete: {summary['successful']}/{summary['total']} successful"
@@ -113,57 +415,89 @@ def run_batch_generation(
     output_dir: str = "output/ai-templates",
     model: str = "anthropic/claude-sonnet-4-5-2025-06-01",
     limit: int | None = None,
+    concurrency: int = 8,
+    use_batch_api: bool = False,
+    cache_dir: str | None = ".cache/llm",
+    requests_per_minute: float | None = None,
 ) -> dict:
-    """Convenience function to run batch template generation."""
-    client = OpenRouterClient(model=model)
+    """Convenience function to run batch template generation.
+
+    Responses are cached under cache_dir so re-runs over the same snapshots
+    skip the API; pass cache_dir=None to always call the model.
+    concurrency bounds in-flight calls, requests_per_minute bounds their rate.
+    """
+    cache = LLMCache(cache_dir) if cache_dir else None
+    client = OpenRouterClient(
+        model=model, cache=cache, requests_per_minute=requests_per_minute
+    )
     processor = BatchTemplateProcessor(client, output_dir)
-    return processor.process_all(snapshot_index, limit)
+    return processor.process_all(snapshot_index, limit, concurrency, use_batch_api)
+
+
+def _load_template_file(path: str) -> dict | None:
+    with open(path, "rb") as f:
+        raw = f.read()
+    # Cheap substring test before paying for a full parse.
+    if b'"template_type"' not in raw:
+        return None
+    template = _loads(raw)
+    return template if template.get("template_type") else None
+
+
+def _template_row(t: dict) -> dict:
+    """shpitto_templates row for one AI-generated template."""
+    get = t.get
+    if "domain" in t:
+        domain = slug_domain = t["domain"]
+    else:
+        domain, slug_domain = "", "unknown"
+    # Only format fallback strings when the template lacks the field.
+    slug = t["slug"] if "slug" in t else f"ai-{slug_domain}"
+    description = (
+        t["description"] if "description" in t else f"AI-generated from {domain}"
+    )
+    return {
+        "name": get("name", "AI Template"),
+        "slug": slug,
+        "source_url": f"https://{domain}",
+        "description": description,
+        "puck_data": get("puck_data", {}),
+        "visual_spec": get("visual_spec", {}),
+        "template_type": get("template_type", "page"),
+        "template_kind": get("template_kind", "landing"),
+        "template_source": "ai-generated",
+    }
 
 
 def import_to_template_library(
     ai_templates_dir: str = "output/ai-templates",
     supabase_url: str | None = None,
     supabase_key: str | None = None,
+    chunk_size: int = 50,
 ) -> dict:
-    """Import AI-generated templates to the template library."""
-    import ssl
-    import urllib.request
-    import urllib.error
+    """Import AI-generated templates to the template library.
 
+    Templates are upserted in chunks of chunk_size over one keep-alive
+    connection, so a failure only affects its own chunk.
+    """
     url = supabase_url or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
     key = supabase_key or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
     if not url or not key:
         raise ValueError("Supabase credentials not set")
 
-    template_dir = Path(ai_templates_dir)
-    all_templates = []
-
-    for file_path in template_dir.glob("*.json"):
-        if file_path.name == "batch_summary.json":
-            continue
-        with file_path.open("r", encoding="utf-8") as f:
-            template = json.load(f)
-            if template.get("template_type"):
-                all_templates.append(template)
+    with os.scandir(ai_templates_dir) as entries:
+        template_paths = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.name != "batch_summary.json"
+        ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        all_templates = [
+            t for t in pool.map(_load_template_file, template_paths) if t is not None
+        ]
 
-    # Prepare payload
-    def build_payload(t):
-        return {
-            "name": t.get("name", "AI Template"),
-            "slug": t.get("slug", f"ai-{t.get('domain', 'unknown')}"),
-            "source_url": f"https://{t.get('domain', '')}",
-            "description": t.get(
-                "description", f"AI-generated from {t.get('domain', '')}"
-            ),
-            "puck_data": t.get("puck_data", {}),
-            "visual_spec": t.get("visual_spec", {}),
-            "template_type": t.get("template_type", "page"),
-            "template_kind": t.get("template_kind", "landing"),
-            "template_source": "ai-generated",
-        }
-
-    payload = [build_payload(t) for t in all_templates]
+    payload = [_template_row(t) for t in all_templates]
 
     endpoint = f"{url}/rest/v1/shpitto_templates?on_conflict=slug"
     headers = {
@@ -173,16 +507,18 @@ def import_to_template_library(
         "Prefer": "resolution=merge-duplicates",
     }
 
-    context = ssl._create_unverified_context()
-    data = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(
-        endpoint, data=data, headers=headers, method="POST"
-    )
+    step = max(1, chunk_size)
+    imported = 0
+    with httpx.Client(timeout=120.0, headers=headers, http2=_HTTP2) as client:
+        for start in range(0, len(payload), step):
+            chunk = payload[start : start + step]
+            response = client.post(endpoint, content=_dumps(chunk))
+            if response.is_error:
+                raise RuntimeError(
+                    f"Import failed after {imported} templates: "
+                    f"{response.status_code} {response.reason_phrase} {response.text}"
+                )
+            imported += len(chunk)
 
-    try:
-        with urllib.request.urlopen(request, timeout=120, context=context) as response:
-            print(f"Imported {len(payload)} templates to Supabase")
-            return {"imported": len(payload), "status": "success"}
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else ""
-        raise RuntimeError(f"Import failed: {e.code} {e.reason} {error_body}")
+    print(f"Imported {imported} templates to Supabase")
+    return {"imported": imported, "status": "success"}
@@ -0,0 +1,60 @@
+"""
+On-disk cache for LLM responses.
+
+Screenshots and DOM snapshots are stable inputs, so an exact hash of the
+request (model + image + prompt + sampling params) is enough to replay a
+previous response instead of paying for the call again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+class LLMCache:
+    """Content-addressed response store under `dir/<key[:2]>/<key>.json`."""
+
+    def __init__(self, dir: str | Path = ".cache/llm"):
+        self.dir = Path(dir)
+
+    @staticmethod
+    def key(*parts: bytes) -> str:
+        digest = hashlib.blake2b(digest_size=32)
+        for part in parts:
+            # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:
+            # Truncated or corrupt entry: treat as a miss, it gets rewritten.
+            return None
+
+    def put(self, key: str, response: Any) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            data = orjson.dumps(response)
+        else:
+            data = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        # Write then rename so concurrent readers never see a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
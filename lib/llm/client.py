@@ -3,175 +3,192 @@ LLM Client for template generation using OpenRouter.
 Supports Claude Sonnet 4.5 and Gemini 2.5 Flash with vision capabilities.
 """
 
+import asyncio
 import base64
+import functools
+import importlib.util
 import json
+import mmap
 import os
+import random
+import re
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 
-
-class OpenRouterClient:
-    """Client for calling LLMs through OpenRouter."""
-
-    def __init__(
-        self,
-        model: str = "anthropic/claude-sonnet-4-5-2025-06-01",
-        api_key: str | None = None,
-        base_url: str = "https://openrouter.ai/api/v1",
-    ):
-        self.model = model
-        self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
-        self.base_url = base_url
-        if not self.api_key:
-            raise ValueError("OPENROUTER_API_KEY not set")
-
-    def call(
-        self,
-        messages: list[dict],
-        max_tokens: int = 4000,
-        temperature: float = 0.2,
-    ) -> dict:
-        """Call OpenRouter API."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://shipitto.com",
-            "X-Title": "Shipitto Template Generator",
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            return response.json()
-
-    def call_with_image(
-        self,
-        image_path: str | Path,
-        prompt: str,
-        max_tokens: int = 4000,
-    ) -> dict:
-        """Call with base64 encoded image."""
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-
-        content = [
-            {"type": "text", "text": prompt},
-            {
-                "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{image_data}"},
-            },
-        ]
-
-        messages = [{"role": "user", "content": content}]
-        return self.call(messages, max_tokens=max_tokens)
-
-
-class TemplateReconstructor:
-    """Reconstruct templates from screenshots + DOM snapshots using LLM."""
-
-    def __init__(self, llm_client: OpenRouterClient):
-        self.llm = llm_client
-
-    def build_vision_prompt(self, dom_snapshot: dict, site_name: str) -> str:
-        """Build prompt for visual template reconstruction."""
-        return f"""You are an expert web designer. Analyze the website screenshot and DOM data to extract the visual design system.
-
-Website: {site_name}
+from .cache import LLMCache
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+# HTTP/2 lets concurrent requests share one connection; it needs the h2 extra.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Responses that mean "slow down and try again" rather than a real failure.
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRIES = 5
+_BACKOFF_BASE = 0.5
+_BACKOFF_MAX = 30.0
+
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_JSON_STRUCT_RE = re.compile(r'[{}"\\]')
+_RAW_DECODER = json.JSONDecoder()
+_PROMPT_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# Sized for the default batch pipeline: 8 prefetched sites plus 8 in flight.
+@functools.lru_cache(maxsize=16)
+def _image_base64_cached(path_str: str, mtime_ns: int) -> str:
+    with open(path_str, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        # Encode straight from the page cache instead of copying into bytes.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.b64encode(mapped).decode("ascii")
+
+
+def image_base64(image_path: str | Path) -> str:
+    """Base64 of an image file, memoized per (path, mtime)."""
+    path = Path(image_path)
+    return _image_base64_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _first_json_object(content: str) -> str | None:
+    """Return the first balanced {...} in content, ignoring braces in strings."""
+    start = content.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    skip_to = start
+    for match in _JSON_STRUCT_RE.finditer(content, start):
+        pos = match.start()
+        if pos < skip_to:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                skip_to = pos + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return content[start : pos + 1]
+    # Unbalanced (e.g. truncated output): let the parser report it.
+    return content[start:]
+
+
+# The vision prompt only varies by site name, so it is kept as two
+# prebuilt halves instead of being re-formatted for every site.
+_VISION_PROMPT_HEAD = """You are an expert web designer. Analyze the website screenshot and DOM data to extract the visual design system.
+
+Website: """
+
+_VISION_PROMPT_TAIL = """
 
 Analyze the following DOM snapshot and output a structured design specification in JSON format:
 
 ```json
-{{
-  "visual_spec": {{
-    "colors": {{
+{
+  "visual_spec": {
+    "colors": {
       "primary": "#HEXCODE",
       "secondary": "#HEXCODE", 
       "accent": "#HEXCODE",
       "background": "#HEXCODE",
       "text": "#HEXCODE"
-    }},
-    "typography": {{
+    },
+    "typography": {
       "heading_font": "Font Family Name",
       "body_font": "Font Family Name",
       "heading_weight": 400-900,
       "heading_size": "e.g. 48px",
       "body_size": "e.g. 16px"
-    }},
-    "layout": {{
+    },
+    "layout": {
       "container_width": "e.g. 1440px",
       "border_radius": "none|sm|md|lg|xl",
       "grid_columns": 12,
       "visual_density": "airy|balanced|compact",
       "gap": "e.g. 24px"
-    }},
+    },
     "theme": "light|dark|auto"
-  }},
+  },
   "page_structure": [
-    {{
+    {
       "name": "Hero",
       "type": "Hero",
-      "props": {{
+      "props": {
         "title": "Main headline text",
         "description": "Subheading or description",
         "cta_text": "Button text if visible",
         "alignment": "left|center",
         "background_style": "gradient|solid|image|none"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "name": "Features",
       "type": "FeatureGrid|ValuePropositions",
-      "props": {{
+      "props": {
         "title": "Section title",
         "item_count": 3-6,
         "layout": "grid|list|cards"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "name": "Social Proof",
       "type": "Testimonials|Logos",
-      "props": {{
+      "props": {
         "title": "Section title",
         "style": "cards|slider|grid"
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "name": "CTA",
       "type": "CTASection",
-      "props": {{
+      "props": {
         "title": "Call to action text",
         "button_text": "Button label"
-      }}
-    }}
+      }
+    }
   ],
-  "component_details": {{
-    "buttons": {{
+  "component_details": {
+    "buttons": {
       "style": "fill|outline|ghost|soft",
       "border_radius": "none|sm|md|lg|xl",
       "padding": "e.g. 12px 24px"
-    }},
-    "cards": {{
+    },
+    "cards": {
       "style": "flat|bordered|elevated|glass",
       "shadow": "none|subtle|medium|strong"
-    }},
-    "navigation": {{
+    },
+    "navigation": {
       "style": "horizontal|stacked|sidebar|hamburger"
-    }}
-  }}
-}}
+    }
+  }
+}
 ```
 
 Important:
@@ -183,52 +200,355 @@ Important:
 
 Return ONLY the JSON, no markdown formatting."""
 
-    def build_structured_prompt(self, dom_snapshot: dict, visual_spec: dict) -> str:
-        """Build prompt combining DOM and visual analysis."""
-        page_content = dom_snapshot.get("elements", [])[:100]
 
-        return f"""Based on the DOM structure and visual design, generate a complete Puck template specification.
+# Static pieces of the structured prompt, joined around the per-site values.
+_STRUCTURED_PROMPT_INTRO = """Based on the DOM structure and visual design, generate a complete Puck template specification.
 
 Visual Design:
-{json.dumps(visual_spec, indent=2)}
+"""
+_STRUCTURED_PROMPT_DOM = """
 
 DOM Structure (top elements):
-{json.dumps(page_content, indent=2)[:3000]}
+"""
+_STRUCTURED_PROMPT_COLORS = """
 
 Generate the full Puck template JSON:
 
 ```json
-{{
+{
   "name": "Template Name",
   "slug": "template-slug",
   "template_type": "page",
   "template_kind": "landing",
   "template_source": "ai-generated",
   "description": "Brief description",
-  "puck_data": {{
-    "root": {{
-      "props": {{
+  "puck_data": {
+    "root": {
+      "props": {
         "title": "Site Title",
-        "branding": {{
+        "branding": {
           "name": "Brand Name",
-          "colors": {visual_spec["colors"]},
-          "style": {{
-            "typography": "{visual_spec["typography"]["heading_font"]}",
-            "borderRadius": "{visual_spec["layout"]["border_radius"]}"
-          }}
-        }}
-      }}
-    }},
+          "colors": """
+_STRUCTURED_PROMPT_FONT = """,
+          "style": {
+            "typography": \""""
+_STRUCTURED_PROMPT_RADIUS = """\",
+            "borderRadius": \""""
+_STRUCTURED_PROMPT_SPEC = """\"
+          }
+        }
+      }
+    },
     "content": [
       // Generate sections based on page_structure from visual analysis
     ]
-  }},
-  "visual_spec": {visual_spec}
-}}
+  },
+  "visual_spec": """
+_STRUCTURED_PROMPT_END = """
+}
 ```
 
 Return ONLY valid JSON, no markdown."""
 
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled response."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _BACKOFF_MAX)
+        except ValueError:
+            pass
+    reset = response.headers.get("x-ratelimit-reset")
+    if reset:
+        try:
+            # OpenRouter reports the reset time as epoch milliseconds.
+            wait = float(reset) / 1000 - time.time()
+            if wait > 0:
+                return min(wait, _BACKOFF_MAX)
+        except ValueError:
+            pass
+    backoff = min(_BACKOFF_BASE * 2**attempt, _BACKOFF_MAX)
+    return backoff * random.uniform(0.5, 1.0)
+
+
+class _RateLimiter:
+    """Spaces request starts so at most `requests_per_minute` begin per minute.
+
+    reserve() never awaits, so it is atomic with respect to other tasks on
+    the event loop and needs no lock.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        self._next_start = 0.0
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        return start - now
+
+
+class OpenRouterClient:
+    """Client for calling LLMs through OpenRouter."""
+
+    def __init__(
+        self,
+        model: str = "anthropic/claude-sonnet-4-5-2025-06-01",
+        api_key: str | None = None,
+        base_url: str = "https://openrouter.ai/api/v1",
+        cache: LLMCache | None = None,
+        requests_per_minute: float | None = None,
+    ):
+        self.model = model
+        self.cache = cache
+        self._rate_limiter = (
+            _RateLimiter(requests_per_minute) if requests_per_minute else None
+        )
+        self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
+        self.base_url = base_url
+        if not self.api_key:
+            raise ValueError("OPENROUTER_API_KEY not set")
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://shipitto.com",
+            "X-Title": "Shipitto Template Generator",
+        }
+
+    def _client_options(self) -> dict:
+        return {
+            "timeout": 120.0,
+            "headers": self._headers(),
+            "http2": _HTTP2,
+            "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        }
+
+    def _cache_key(self, *parts: bytes) -> str | None:
+        if self.cache is None:
+            return None
+        return self.cache.key(self.model.encode("utf-8"), *parts)
+
+    def _messages_key(
+        self, messages: list[dict], max_tokens: int, temperature: float
+    ) -> str | None:
+        if self.cache is None:
+            return None
+        return self._cache_key(
+            json.dumps(messages, sort_keys=True).encode("utf-8"),
+            f"{max_tokens}:{temperature}".encode("utf-8"),
+        )
+
+    def _image_key(
+        self, image_path: str | Path, prompt: str, max_tokens: int
+    ) -> str | None:
+        if self.cache is None:
+            return None
+        return self._cache_key(
+            Path(image_path).read_bytes(),
+            prompt.encode("utf-8"),
+            str(max_tokens).encode("utf-8"),
+        )
+
+    def _payload(
+        self, messages: list[dict], max_tokens: int, temperature: float
+    ) -> dict:
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    @staticmethod
+    def _image_messages(image_path: str | Path, prompt: str) -> list[dict]:
+        image_data = image_base64(image_path)
+        content = [
+            {"type": "text", "text": prompt},
+            {
+                "type": "image_url",
+                "image_url": {"url": f"data:image/png;base64,{image_data}"},
+            },
+        ]
+        return [{"role": "user", "content": content}]
+
+    def call(
+        self,
+        messages: list[dict],
+        max_tokens: int = 4000,
+        temperature: float = 0.2,
+    ) -> dict:
+        """Call OpenRouter API over a pooled keep-alive connection."""
+        return self._send(
+            self._messages_key(messages, max_tokens, temperature),
+            lambda: self._payload(messages, max_tokens, temperature),
+        )
+
+    def _cached(self, cache_key: str | None) -> dict | None:
+        if cache_key is None:
+            return None
+        return self.cache.get(cache_key)
+
+    def _send(self, cache_key: str | None, build_payload: Callable[[], dict]) -> dict:
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        if self._client is None:
+            self._client = httpx.Client(**self._client_options())
+        # Serialize once with orjson rather than httpx's stdlib json encoder.
+        body = _dumps(build_payload())
+        for attempt in range(_MAX_RETRIES + 1):
+            if self._rate_limiter is not None:
+                time.sleep(self._rate_limiter.reserve())
+            response = self._client.post(
+                f"{self.base_url}/chat/completions", content=body
+            )
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            time.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        result = response.json()
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+
+    def call_with_image(
+        self,
+        image_path: str | Path,
+        prompt: str,
+        max_tokens: int = 4000,
+    ) -> dict:
+        """Call with base64 encoded image."""
+        # Keyed on the raw image bytes so cache hits skip base64 encoding.
+        return self._send(
+            self._image_key(image_path, prompt, max_tokens),
+            lambda: self._payload(
+                self._image_messages(image_path, prompt), max_tokens, 0.2
+            ),
+        )
+
+    async def acall(
+        self,
+        messages: list[dict],
+        max_tokens: int = 4000,
+        temperature: float = 0.2,
+    ) -> dict:
+        """Async variant of call() sharing one AsyncClient across requests."""
+        cache_key = self._messages_key(messages, max_tokens, temperature)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        return await self._asend(
+            cache_key, self._payload(messages, max_tokens, temperature)
+        )
+
+    async def _asend(self, cache_key: str | None, payload: dict) -> dict:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_options())
+        body = _dumps(payload)
+        for attempt in range(_MAX_RETRIES + 1):
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+            response = await self._async_client.post(
+                f"{self.base_url}/chat/completions", content=body
+            )
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        result = response.json()
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+        return result
+
+    async def acall_with_image(
+        self,
+        image_path: str | Path,
+        prompt: str,
+        max_tokens: int = 4000,
+    ) -> dict:
+        """Async variant of call_with_image()."""
+        cache_key = await asyncio.to_thread(
+            self._image_key, image_path, prompt, max_tokens
+        )
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        messages = await asyncio.to_thread(self._image_messages, image_path, prompt)
+        return await self._asend(cache_key, self._payload(messages, max_tokens, 0.2))
+
+    def close(self) -> None:
+        """Close the pooled sync client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "OpenRouterClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the shared AsyncClient (it is bound to the running event loop)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self) -> "OpenRouterClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class TemplateReconstructor:
+    """Reconstruct templates from screenshots + DOM snapshots using LLM."""
+
+    def __init__(self, llm_client: OpenRouterClient):
+        self.llm = llm_client
+
+    def build_vision_prompt(self, site_name: str) -> str:
+        """Build prompt for visual template reconstruction."""
+        return _VISION_PROMPT_HEAD + site_name + _VISION_PROMPT_TAIL
+
+    def build_structured_prompt(self, dom_snapshot: dict, visual_spec: dict) -> str:
+        """Build prompt combining DOM and visual analysis."""
+        page_content = dom_snapshot.get("elements", [])[:100]
+        # Only the first 3000 characters are kept, so stop encoding once
+        # they exist instead of serializing every element.
+        dom_chunks: list[str] = []
+        dom_length = 0
+        for chunk in _PROMPT_ENCODER.iterencode(page_content):
+            dom_chunks.append(chunk)
+            dom_length += len(chunk)
+            if dom_length >= 3000:
+                break
+        dom_excerpt = "".join(dom_chunks)[:3000]
+
+        return "".join(
+            [
+                _STRUCTURED_PROMPT_INTRO,
+                json.dumps(visual_spec, indent=2),
+                _STRUCTURED_PROMPT_DOM,
+                dom_excerpt,
+                _STRUCTURED_PROMPT_COLORS,
+                str(visual_spec["colors"]),
+                _STRUCTURED_PROMPT_FONT,
+                str(visual_spec["typography"]["heading_font"]),
+                _STRUCTURED_PROMPT_RADIUS,
+                str(visual_spec["layout"]["border_radius"]),
+                _STRUCTURED_PROMPT_SPEC,
+                str(visual_spec),
+                _STRUCTURED_PROMPT_END,
+            ]
+        )
+
     def reconstruct_from_screenshot(
         self,
         screenshot_path: str | Path,
@@ -237,8 +557,8 @@ Return ONLY valid JSON, no markdown."""
     ) -> dict:
         """Main method: reconstruct template from screenshot + DOM."""
         # Step 1: Analyze screenshot for visual specs
-        dom_snapshot = json.loads(Path(dom_snapshot_path).read_text())
-        prompt = self.build_vision_prompt(dom_snapshot, site_name)
+        dom_snapshot = _loads(Path(dom_snapshot_path).read_bytes())
+        prompt = self.build_vision_prompt(site_name)
 
         response = self.llm.call_with_image(screenshot_path, prompt, max_tokens=4000)
         content = response["choices"][0]["message"]["content"]
@@ -254,6 +574,47 @@ Return ONLY valid JSON, no markdown."""
         )
         template_content = template_response["choices"][0]["message"]["content"]
 
+        return self._finish_template(template_content, site_name, visual_spec)
+
+    async def areconstruct_from_screenshot(
+        self,
+        screenshot_path: str | Path,
+        dom_snapshot_path: str | Path,
+        site_name: str,
+    ) -> dict:
+        """Async variant of reconstruct_from_screenshot()."""
+        dom_snapshot = _loads(Path(dom_snapshot_path).read_bytes())
+        visual_spec = await self.aanalyze_screenshot(screenshot_path, site_name)
+        return await self.agenerate_template(dom_snapshot, visual_spec, site_name)
+
+    async def aanalyze_screenshot(
+        self,
+        screenshot_path: str | Path,
+        site_name: str,
+    ) -> dict:
+        """Step 1: extract the visual spec from the screenshot."""
+        prompt = self.build_vision_prompt(site_name)
+        response = await self.llm.acall_with_image(
+            screenshot_path, prompt, max_tokens=4000
+        )
+        content = response["choices"][0]["message"]["content"]
+        return self._extract_json(content, "visual_spec")
+
+    async def agenerate_template(
+        self, dom_snapshot: dict, visual_spec: dict, site_name: str
+    ) -> dict:
+        """Step 2: generate the template from the DOM and visual spec."""
+        template_prompt = self.build_structured_prompt(dom_snapshot, visual_spec)
+        template_response = await self.llm.acall(
+            [{"role": "user", "content": template_prompt}],
+            max_tokens=6000,
+        )
+        template_content = template_response["choices"][0]["message"]["content"]
+        return self._finish_template(template_content, site_name, visual_spec)
+
+    def _finish_template(
+        self, template_content: str, site_name: str, visual_spec: dict
+    ) -> dict:
         template = self._extract_json(template_content, "puck_data")
         template["name"] = f"{site_name.title()} AI Template"
         template["slug"] = f"{site_name.lower().replace('.', '-')}-ai"
@@ -265,37 +626,35 @@ Return ONLY valid JSON, no markdown."""
     def _extract_json(self, content: str, key: str) -> dict:
         """Extract JSON from LLM response."""
         # Try to find JSON block
-        import re
-
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", content)
+        json_match = _JSON_BLOCK_RE.search(content)
         if json_match:
             json_str = json_match.group(1)
         else:
-            # Find first { and last }
-            start = content.find("{")
-            end = content.rfind("}")
-            if start != -1 and end != -1:
-                json_str = content[start : end + 1]
-            else:
-                json_str = content
+            json_str = _first_json_object(content) or content
 
         try:
-            parsed = json.loads(json_str)
-            return parsed.get(key, parsed)
+            parsed = _loads(json_str)
         except json.JSONDecodeError:
-            # Return as-is if can't parse
-            return {}
+            try:
+                # Accept a valid object followed by trailing prose.
+                parsed, _ = _RAW_DECODER.raw_decode(json_str.lstrip())
+            except json.JSONDecodeError:
+                # Return as-is if can't parse
+                return {}
+        return parsed.get(key, parsed)
 
 
 def create_llm_client(
     model: str = "anthropic/claude-sonnet-4-5-2025-06-01",
+    cache_dir: str | Path | None = None,
 ) -> OpenRouterClient:
     """Factory function to create LLM client."""
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
         raise ValueError("OPENROUTER_API_KEY environment variable not set")
 
-    return OpenRouterClient(model=model)
+    cache = LLMCache(cache_dir) if cache_dir else None
+    return OpenRouterClient(model=model, cache=cache)
 
 
 def generate_template_from_snapshot(
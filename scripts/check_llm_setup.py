@@ -3,11 +3,14 @@
 Quick verification script for LLM template generation setup.
 """
 
+import importlib.util
 import json
 import os
 import sys
 from pathlib import Path
 
+REPO_ROOT = str(Path(__file__).parent.parent)
+
 
 def check_python_deps():
     """Check Python dependencies."""
@@ -18,10 +21,10 @@ def check_python_deps():
     ]
     all_ok = True
     for pkg, import_name in deps:
-        try:
-            __import__(import_name)
+        # find_spec locates the package without executing it.
+        if importlib.util.find_spec(import_name) is not None:
             print(f"  ✓ {pkg}")
-        except ImportError:
+        else:
             print(f"  ✗ {pkg} (not installed)")
             all_ok = False
     return all_ok
@@ -61,7 +64,8 @@ def check_lib():
     """Check if LLM lib modules can be imported."""
     print("\n📁 Checking LLM library modules...")
     try:
-        sys.path.insert(0, str(Path(__file__).parent.parent))
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
         from lib.llm import create_llm_client, BatchTemplateProcessor
 
         print("  ✓ lib.llm imported successfully")
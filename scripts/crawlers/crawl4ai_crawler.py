@@ -6,18 +6,228 @@ Supports JavaScript rendering and generates markdown for easier analysis.
 """
 
 import asyncio
+import functools
 import json
+import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse, urljoin
 
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except Exception:
+    HTMLParser = None
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Skips markdown images (`![alt](src)`), which would otherwise read as links.
+_MD_LINK_RE = re.compile(r"(?<!!)\[([^\]]+)\]\(([^)]+)\)")
+_IMG_RE = re.compile(r'<img[^>]+src="([^"]+)"[^>]+alt="([^"]*)"[^>]*>')
+
+
+COLOR_PATTERNS = [
+    (
+        "dark",
+        [
+            "bg-slate-900",
+            "bg-gray-900",
+            "bg-black",
+            "dark",
+            "#0f172a",
+            "#1e293b",
+        ],
+    ),
+    ("light", ["bg-white", "bg-gray-50", "bg-slate-50", "#ffffff", "#f8fafc"]),
+    ("blue", ["bg-blue-", "text-blue-", "#0066ff", "#3b82f6", "#1d4ed8"]),
+    ("green", ["bg-green-", "text-green-", "#10b981", "#059669"]),
+    ("orange", ["bg-orange-", "text-orange-", "#f97316", "#ea580c"]),
+    ("purple", ["bg-purple-", "text-purple-", "#8b5cf6", "#7c3aed"]),
+]
+
+FONT_PATTERNS = {
+    "sans-serif": [
+        "Inter",
+        "Roboto",
+        "Space Grotesk",
+        "Oswald",
+        "Helvetica",
+        "sans-serif",
+    ],
+    "serif": ["Cormorant Garamond", "Playfair", "Merriweather", "serif"],
+    "mono": ["Space Mono", "JetBrains Mono", "Fira Code", "mono"],
+}
+
+SECTION_PATTERNS = {
+    "hero": ["hero", "header", "banner", "jumbotron"],
+    "features": ["features", "benefits", "why us", "what we do"],
+    "pricing": ["pricing", "plans", "pricing table", "get started"],
+    "testimonials": ["testimonials", "reviews", "what they say", "customer"],
+    "cta": ["cta", "call to action", "get started", "sign up"],
+    "footer": ["footer", "links", "contact us"],
+}
+
+CHAT_PATTERNS = [
+    "intercom",
+    "crisp",
+    "tawk.to",
+    "livechat",
+    "drift",
+    "chatwoot",
+    "zendesk",
+    "hubspot",
+]
+
+ANALYTICS_PATTERNS = [
+    "google-analytics.com",
+    "gtag(",
+    "gtm.js",
+    "googletagmanager",
+    "hm.baidu.com",
+]
+
+_KEYWORDS = sorted(
+    {p for _, patterns in COLOR_PATTERNS for p in patterns}
+    | {f.lower() for fonts in FONT_PATTERNS.values() for f in fonts}
+    | {kw for keywords in SECTION_PATTERNS.values() for kw in keywords}
+    | set(CHAT_PATTERNS)
+    | set(ANALYTICS_PATTERNS)
+    | {"grid", "flex", "display: grid", "display: flex"}
+)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_hits(text_lower: str) -> frozenset:
+    """Keywords from the pattern tables that occur in already lower-cased text.
+
+    One Aho-Corasick pass replaces a substring scan per keyword; the cache
+    lets every analyzer share the scan of the same page markdown/HTML.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return frozenset(kw for kw in _KEYWORDS if kw in text_lower)
+    return frozenset(kw for _, kw in _KEYWORD_AUTOMATON.iter(text_lower))
+
+
+def _ascii_lower(text: str) -> str:
+    """Lower-case only ASCII letters, for keyword scans over raw HTML.
+
+    bytes.lower() is a plain C loop, unlike str.lower()'s Unicode case tables,
+    which matters on large non-English pages. Non-ASCII characters come back
+    as their UTF-8 bytes read as Latin-1; every keyword is ASCII, so matches
+    are unaffected.
+    """
+    return text.encode("utf-8", "ignore").lower().decode("latin-1")
+
+
+@functools.lru_cache(maxsize=64)
+def _netloc(url: str) -> str:
+    """Host part of `url`; memoized since every link is checked against its page."""
+    return urlparse(url).netloc
+
+
+def _parse_html(html: str, max_paragraphs: int = 20) -> dict:
+    """Pull title, description, headings, paragraphs, anchors and form count.
+
+    Anchors are collected once as `(text, href)` pairs and shared by the CTA
+    and link extractors. Paragraph text is only extracted until
+    `max_paragraphs` non-empty paragraphs have been found.
+
+    Uses selectolax's Lexbor (C) parser when available, BeautifulSoup otherwise.
+    """
+    headings = {"h1": [], "h2": [], "h3": [], "h4": []}
+
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        title_node = tree.css_first("title")
+        meta_desc = tree.css_first('meta[name="description"]')
+        h1 = None
+        # One walk over all heading levels, in document order.
+        for h in tree.css("h1, h2, h3, h4"):
+            if h1 is None and h.tag == "h1":
+                h1 = h
+            text = h.text(strip=True)
+            if text:
+                headings[h.tag].append(text)
+        paragraphs = list(
+            islice(
+                (text for p in tree.css("p") if (text := p.text(strip=True))),
+                max_paragraphs,
+            )
+        )
+        anchors = [
+            (a.text(separator=" ", strip=True), href)
+            for a in tree.css("a[href]")
+            if (href := a.attributes.get("href"))
+        ]
+        return {
+            "title": title_node.text() if title_node else "",
+            "description": (meta_desc.attributes.get("content") or "")
+            if meta_desc
+            else "",
+            "h1": h1.text(strip=True) if h1 else "",
+            "headings": headings,
+            "paragraphs": paragraphs,
+            "anchors": anchors,
+            "form_count": len(tree.css("form")),
+        }
 
-@dataclass
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    meta_desc = soup.find("meta", {"name": "description"})
+    h1 = None
+    for h in soup.find_all(list(headings)):
+        if h1 is None and h.name == "h1":
+            h1 = h
+        text = h.get_text(strip=True)
+        if text:
+            headings[h.name].append(text)
+    paragraphs = list(
+        islice(
+            (text for p in soup.find_all("p") if (text := p.get_text(strip=True))),
+            max_paragraphs,
+        )
+    )
+    anchors = [
+        (a.get_text(" ", strip=True), a["href"])
+        for a in soup.find_all("a", href=True)
+        if a["href"]
+    ]
+    return {
+        "title": soup.title.string if soup.title else "",
+        "description": meta_desc.get("content", "") if meta_desc else "",
+        "h1": h1.get_text(strip=True) if h1 else "",
+        "headings": headings,
+        "paragraphs": paragraphs,
+        "anchors": anchors,
+        "form_count": len(soup.find_all("form")),
+    }
+
+
+@dataclass(slots=True)
 class PageAnalysis:
     """Analysis result for a single page."""
 
@@ -40,7 +250,7 @@ class PageAnalysis:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class WebsiteAnalysis:
     """Complete analysis for a website."""
 
@@ -75,16 +285,45 @@ class Crawl4AICrawler:
         "blog": ["blog", "news", "updates", "journal", "insights"],
     }
 
-    def __init__(self, max_concurrent: int = 3):
+    # Inverted index: pattern -> (precedence, page type). Earlier page types
+    # win, and "" stands for the site root.
+    _PATTERN_TO_TYPE = {
+        pattern: (rank, page_type)
+        for rank, (page_type, patterns) in reversed(
+            list(enumerate(PAGE_TYPE_PATTERNS.items()))
+        )
+        for pattern in patterns
+    }
+
+    # Navigation text keeps substring matching, as one alternation scan over
+    # the page types that are specific enough to infer from nav labels.
+    _NAV_PATTERN_TO_TYPE = {
+        pattern: rank_type
+        for pattern, rank_type in _PATTERN_TO_TYPE.items()
+        if rank_type[1] not in ("home", "contact", "blog")
+    }
+    _NAV_PATTERN_RE = re.compile(
+        "|".join(map(re.escape, sorted(_NAV_PATTERN_TO_TYPE, key=len, reverse=True)))
+    )
+
+    def __init__(
+        self, max_concurrent: int = 3, per_host_limit: int = 8, max_retries: int = 3
+    ):
         self.max_concurrent = max_concurrent
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
         self.session: Optional[AsyncWebCrawler] = None
         self.visited_urls: set = set()
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
 
     async def __aenter__(self):
-        config = CrawlerRunConfig(
+        # Built once and shared by every crawl_page call.
+        self._run_config = CrawlerRunConfig(
             remove_overlay_elements=True,
             cache_mode=CacheMode.BYPASS,
+            word_count_threshold=10,
         )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
         self.session = AsyncWebCrawler()
         await self.session.start()
         return self
@@ -92,6 +331,7 @@ class Crawl4AICrawler:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        self._executor.shutdown(wait=False)
 
     def normalize_url(self, url: str, base_url: str) -> Optional[str]:
         """Normalize and validate URL."""
@@ -104,33 +344,37 @@ class Crawl4AICrawler:
             url = "https:" + url
         elif not url.startswith("http"):
             url = urljoin(base_url, url)
-        parsed = urlparse(url)
-        if parsed.netloc != urlparse(base_url).netloc:
+        if urlparse(url).netloc != _netloc(base_url):
             return None
         return url
 
-    def classify_page_type(self, url: str, title: str, nav_links: list) -> str:
-        """Classify page type based on URL, title, and navigation."""
-        url_lower = url.lower()
-        title_lower = title.lower()
-
-        for page_type, patterns in self.PAGE_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower or pattern in title_lower:
-                    return page_type
+    def classify_page_type(self, url: str, title: str, nav_texts: str) -> str:
+        """Classify page type based on URL, title, and lower-cased nav text."""
+        path = urlparse(url).path.lower()
+        tokens = set(_WORD_RE.findall(path))
+        tokens.update(_WORD_RE.findall(title.lower()))
+        if not path.strip("/"):
+            tokens.add("")
+
+        matches = [
+            self._PATTERN_TO_TYPE[token]
+            for token in tokens
+            if token in self._PATTERN_TO_TYPE
+        ]
+        if matches:
+            return min(matches)[1]
 
-        nav_texts = " ".join([link.get("text", "").lower() for link in nav_links])
-        for page_type, patterns in self.PAGE_TYPE_PATTERNS.items():
-            if page_type in ["home", "contact", "blog"]:
-                continue
-            for pattern in patterns:
-                if pattern in nav_texts:
-                    return page_type
+        matches = [
+            self._NAV_PATTERN_TO_TYPE[match.group()]
+            for match in self._NAV_PATTERN_RE.finditer(nav_texts)
+        ]
+        if matches:
+            return min(matches)[1]
 
         return "landing"
 
-    def extract_colors_from_markdown(self, markdown: str) -> dict:
-        """Extract color-related visual features from markdown/HTML."""
+    def extract_colors_from_markdown(self, md_lower: str) -> dict:
+        """Extract color-related visual features from lower-cased markdown."""
         colors = {
             "background": None,
             "text": None,
@@ -139,84 +383,43 @@ class Crawl4AICrawler:
             "accent": None,
         }
 
-        color_patterns = [
-            (
-                "dark",
-                [
-                    "bg-slate-900",
-                    "bg-gray-900",
-                    "bg-black",
-                    "dark",
-                    "#0f172a",
-                    "#1e293b",
-                ],
-            ),
-            ("light", ["bg-white", "bg-gray-50", "bg-slate-50", "#ffffff", "#f8fafc"]),
-            ("blue", ["bg-blue-", "text-blue-", "#0066ff", "#3b82f6", "#1d4ed8"]),
-            ("green", ["bg-green-", "text-green-", "#10b981", "#059669"]),
-            ("orange", ["bg-orange-", "text-orange-", "#f97316", "#ea580c"]),
-            ("purple", ["bg-purple-", "text-purple-", "#8b5cf6", "#7c3aed"]),
-        ]
-
-        for color_name, patterns in color_patterns:
-            for pattern in patterns:
-                if pattern in markdown.lower():
-                    colors["accent"] = color_name
-                    break
+        # The last matching group wins, so scan from the end and stop early.
+        hits = _keyword_hits(md_lower)
+        for color_name, patterns in reversed(COLOR_PATTERNS):
+            if any(pattern in hits for pattern in patterns):
+                colors["accent"] = color_name
+                break
 
         return colors
 
-    def extract_fonts_from_markdown(self, markdown: str) -> dict:
-        """Extract font-related features from markdown/HTML."""
+    def extract_fonts_from_markdown(self, md_lower: str) -> dict:
+        """Extract font-related features from lower-cased markdown."""
         fonts = {
             "heading_font": None,
             "body_font": None,
             "font_weights": [],
         }
 
-        font_patterns = {
-            "sans-serif": [
-                "Inter",
-                "Roboto",
-                "Space Grotesk",
-                "Oswald",
-                "Helvetica",
-                "sans-serif",
-            ],
-            "serif": ["Cormorant Garamond", "Playfair", "Merriweather", "serif"],
-            "mono": ["Space Mono", "JetBrains Mono", "Fira Code", "mono"],
-        }
-
-        markdown_lower = markdown.lower()
-        for font_type, fonts_list in font_patterns.items():
-            for font in fonts_list:
-                if font.lower() in markdown_lower:
-                    fonts["heading_font"] = font
-                    break
+        # The last matching group wins, so scan from the end and stop early.
+        hits = _keyword_hits(md_lower)
+        for fonts_list in reversed(FONT_PATTERNS.values()):
+            font = next((f for f in fonts_list if f.lower() in hits), None)
+            if font:
+                fonts["heading_font"] = font
+                break
 
         if not fonts["heading_font"]:
             fonts["heading_font"] = "Inter"
 
         return fonts
 
-    def analyze_structure(self, markdown: str, html: str) -> list:
-        """Analyze page structure and identify sections."""
+    def analyze_structure(self, md_lower: str, html_lower: str) -> list:
+        """Analyze page structure from lower-cased markdown and HTML."""
         sections = []
 
-        section_patterns = {
-            "hero": ["hero", "header", "banner", "jumbotron"],
-            "features": ["features", "benefits", "why us", "what we do"],
-            "pricing": ["pricing", "plans", "pricing table", "get started"],
-            "testimonials": ["testimonials", "reviews", "what they say", "customer"],
-            "cta": ["cta", "call to action", "get started", "sign up"],
-            "footer": ["footer", "links", "contact us"],
-        }
-
-        markdown_lower = markdown.lower()
-        html_lower = html.lower()
-
-        for section_type, keywords in section_patterns.items():
-            if any(kw in markdown_lower or kw in html_lower for kw in keywords):
+        hits = _keyword_hits(md_lower) | _keyword_hits(html_lower)
+        for section_type, keywords in SECTION_PATTERNS.items():
+            if any(kw in hits for kw in keywords):
                 sections.append(
                     {
                         "type": section_type,
@@ -239,23 +442,16 @@ class Crawl4AICrawler:
             ]
         )
 
-    def extract_ctas(self, markdown: str, html: str) -> list:
-        """Extract CTAs from markdown/HTML."""
+    def extract_ctas(self, anchors: list) -> list:
+        """Extract CTAs from the page's `(text, href)` anchors."""
         ctas = []
 
-        cta_patterns = [
-            (r"\[([^\]]+)\]\(([^)]+)\)", "link"),
-            (r"<a[^>]+href=\"([^\"]+)\"[^>]*>([^<]+)</a>", "link"),
-        ]
-
-        for pattern, cta_type in cta_patterns:
-            matches = re.findall(pattern, html, re.IGNORECASE)
-            for url, text in matches[:10]:
-                if text and len(text) < 100:
-                    cta_type = self.classify_cta(text)
-                    ctas.append({"text": text.strip(), "url": url, "type": cta_type})
+        for text, url in anchors[:10]:
+            if text and len(text) < 100:
+                cta_type = self.classify_cta(text)
+                ctas.append({"text": text, "url": url, "type": cta_type})
 
-        return ctas[:10]
+        return ctas
 
     def classify_cta(self, text: str) -> str:
         """Classify CTA type based on text."""
@@ -270,37 +466,35 @@ class Crawl4AICrawler:
             return "info"
         return "general"
 
-    def extract_links(self, html: str, base_url: str) -> list:
-        """Extract internal navigation links."""
+    def extract_links(self, anchors: list, markdown: str, base_url: str) -> list:
+        """Extract internal navigation links from HTML anchors, then markdown."""
         links = []
 
-        link_patterns = [
-            r'<a[^>]+href="([^"]+)"[^>]*>([^<]+)</a>',
-            r"\[([^\]]+)\]\(([^)]+)\)",
-        ]
-
-        for pattern in link_patterns:
-            matches = re.findall(pattern, html)
-            for url, text in matches:
-                normalized = self.normalize_url(url, base_url)
-                if normalized and text.strip():
-                    links.append(
-                        {
-                            "text": text.strip()[:50],
-                            "url": normalized,
-                        }
-                    )
+        md_links = (match.groups() for match in _MD_LINK_RE.finditer(markdown))
+        for text, url in chain(anchors, md_links):
+            text = text.strip()
+            if not text:
+                continue
+            normalized = self.normalize_url(url, base_url)
+            if normalized:
+                links.append(
+                    {
+                        "text": text[:50],
+                        "url": normalized,
+                    }
+                )
+                if len(links) == 20:
+                    break
 
-        return links[:20]
+        return links
 
     def extract_images(self, html: str) -> list:
         """Extract images."""
         images = []
 
-        img_pattern = r'<img[^>]+src="([^"]+)"[^>]+alt="([^"]*)"[^>]*>'
-        matches = re.findall(img_pattern, html)
-
-        for src, alt in matches[:10]:
+        # finditer + islice stops scanning the HTML after the tenth match.
+        for match in islice(_IMG_RE.finditer(html), 10):
+            src, alt = match.groups()
             if src:
                 images.append(
                     {
@@ -325,7 +519,32 @@ class Crawl4AICrawler:
             return "team"
         return "general"
 
-    async def crawl_page(self, url: str) -> Optional[PageAnalysis]:
+    async def _fetch(self, url: str, run_config: CrawlerRunConfig):
+        """Run crawl4ai on `url`, retrying failures with jittered backoff.
+
+        Requests to one host never exceed `per_host_limit` in flight; the slot
+        is released while backing off.
+        """
+        host = urlparse(url).netloc
+        limit = self._host_limits.setdefault(
+            host, asyncio.Semaphore(self.per_host_limit)
+        )
+        for attempt in range(self.max_retries):
+            try:
+                async with limit:
+                    result = await self.session.arun(url=url, config=run_config)
+                if result.success:
+                    return result
+            except Exception:
+                if attempt == self.max_retries - 1:
+                    raise
+            if attempt < self.max_retries - 1:
+                await asyncio.sleep(2**attempt + random.random())
+        return result
+
+    async def crawl_page(
+        self, url: str, run_config: Optional[CrawlerRunConfig] = None
+    ) -> Optional[PageAnalysis]:
         """Crawl and analyze a single page using Crawl4AI."""
         if url in self.visited_urls:
             return None
@@ -335,109 +554,86 @@ class Crawl4AICrawler:
             return None
 
         try:
-            result = await self.session.arun(
-                url=url,
-                config=CrawlerRunConfig(
-                    remove_overlay_elements=True,
-                    cache_mode=CacheMode.BYPASS,
-                    word_count_threshold=10,
-                ),
-            )
+            result = await self._fetch(url, run_config or self._run_config)
 
             if not result.success:
                 return None
 
-            markdown = result.markdown or ""
-            html = result.html or ""
-
-            from bs4 import BeautifulSoup
+            # Parsing and keyword scans are CPU-bound; run them on the crawler's
+            # thread pool so the next page can download meanwhile.
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self._analyze_response,
+                url,
+                result.html or "",
+                result.markdown or "",
+            )
 
-            soup = BeautifulSoup(html, "html.parser")
+        except Exception as e:
+            print(f"Error crawling {url}: {e}")
+            return None
 
-            title = soup.title.string if soup.title else ""
-            meta_desc = soup.find("meta", {"name": "description"})
-            description = meta_desc.get("content", "") if meta_desc else ""
+    def _analyze_response(self, url: str, html: str, markdown: str) -> PageAnalysis:
+        """Build the PageAnalysis for a fetched page's HTML and markdown."""
+        # Only this prefix is stored; the analyzers below read the full text
+        # (or its lower-cased copy) directly.
+        stored_markdown = markdown[:2000]
 
-            h1 = soup.find("h1")
-            h1_text = h1.get_text(strip=True) if h1 else ""
+        parsed = _parse_html(html)
+        title = parsed["title"]
+        description = parsed["description"]
+        h1_text = parsed["h1"]
+        headings = parsed["headings"]
+        paragraphs = parsed["paragraphs"]
 
-            headings = {"h1": [], "h2": [], "h3": [], "h4": []}
-            for level in headings:
-                for h in soup.find_all(level):
-                    text = h.get_text(strip=True)
-                    if text:
-                        headings[level].append(text)
+        ctas = self.extract_ctas(parsed["anchors"])
+        links = self.extract_links(parsed["anchors"], markdown, url)
+        images = self.extract_images(html)
 
-            paragraphs = [
-                p.get_text(strip=True)
-                for p in soup.find_all("p")
-                if p.get_text(strip=True)
-            ]
-
-            ctas = self.extract_ctas(markdown, html)
-            links = self.extract_links(html, url)
-            images = self.extract_images(html)
-
-            visual_features = {
-                "colors": self.extract_colors_from_markdown(markdown),
-                "fonts": self.extract_fonts_from_markdown(markdown),
-                "layout_patterns": {
-                    "has_grid": "grid" in markdown.lower()
-                    or "display: grid" in html.lower(),
-                    "has_flex": "flex" in markdown.lower()
-                    or "display: flex" in html.lower(),
-                },
-            }
-
-            content_structure = self.analyze_structure(markdown, html)
-
-            page_type = self.classify_page_type(url, title, links)
-
-            chat_patterns = [
-                "intercom",
-                "crisp",
-                "tawk.to",
-                "livechat",
-                "drift",
-                "chatwoot",
-                "zendesk",
-                "hubspot",
-            ]
-            has_chat_widget = any(p in html.lower() for p in chat_patterns)
-
-            analytics_patterns = [
-                "google-analytics.com",
-                "gtag(",
-                "gtm.js",
-                "googletagmanager",
-                "hm.baidu.com",
-            ]
-            has_analytics = any(p in html.lower() for p in analytics_patterns)
-
-            form_count = len(soup.find_all("form"))
-
-            return PageAnalysis(
-                url=url,
-                page_type=page_type,
-                title=title,
-                description=description,
-                h1=h1_text,
-                headings=headings,
-                paragraphs=paragraphs[:20],
-                ctas=ctas[:10],
-                links=links[:20],
-                images=images[:10],
-                form_count=form_count,
-                has_chat_widget=has_chat_widget,
-                has_analytics=has_analytics,
-                visual_features=visual_features,
-                content_structure=content_structure,
-                markdown=markdown[:2000],
-            )
+        # Lower-case each buffer once and share it with every analyzer.
+        markdown_lower = markdown.lower()
+        html_lower = _ascii_lower(html)
+        markdown_hits = _keyword_hits(markdown_lower)
+        html_hits = _keyword_hits(html_lower)
+
+        visual_features = {
+            "colors": self.extract_colors_from_markdown(markdown_lower),
+            "fonts": self.extract_fonts_from_markdown(markdown_lower),
+            "layout_patterns": {
+                "has_grid": "grid" in markdown_hits or "display: grid" in html_hits,
+                "has_flex": "flex" in markdown_hits or "display: flex" in html_hits,
+            },
+        }
 
-        except Exception as e:
-            print(f"Error crawling {url}: {e}")
-            return None
+        content_structure = self.analyze_structure(markdown_lower, html_lower)
+
+        nav_texts = " ".join(link["text"] for link in links).lower()
+        page_type = self.classify_page_type(url, title, nav_texts)
+
+        has_chat_widget = any(p in html_hits for p in CHAT_PATTERNS)
+        has_analytics = any(p in html_hits for p in ANALYTICS_PATTERNS)
+
+        form_count = parsed["form_count"]
+
+        return PageAnalysis(
+            url=url,
+            page_type=page_type,
+            title=title,
+            description=description,
+            h1=h1_text,
+            headings=headings,
+            paragraphs=paragraphs,
+            ctas=ctas,
+            links=links,
+            images=images,
+            form_count=form_count,
+            has_chat_widget=has_chat_widget,
+            has_analytics=has_analytics,
+            visual_features=visual_features,
+            content_structure=content_structure,
+            markdown=stored_markdown,
+        )
 
     def to_dict(self, analysis: PageAnalysis) -> dict:
         """Convert PageAnalysis to dict for JSON serialization."""
@@ -478,18 +674,42 @@ class Crawl4AICrawler:
 
         if homepage_analysis and homepage_analysis.links:
             nav_urls = [link["url"] for link in homepage_analysis.links[:15]]
-            semaphore = asyncio.Semaphore(self.max_concurrent)
-
-            async def crawl_with_limit(url):
-                async with semaphore:
-                    return await self.crawl_page(url)
-
-            tasks = [crawl_with_limit(url) for url in nav_urls[:max_pages]]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
+            nav_urls = nav_urls[:max_pages]
+
+            # A fixed pool of max_concurrent workers drains the URL queue, so
+            # a slow page only holds up its own worker.
+            queue: asyncio.Queue = asyncio.Queue()
+            for index, nav_url in enumerate(nav_urls):
+                queue.put_nowait((index, nav_url))
+            results: list = [None] * len(nav_urls)
+
+            async def worker(n: int):
+                # Each worker keeps its own browser tab (crawl4ai session) for
+                # the site, so connections, DNS and cookies carry over between
+                # its pages instead of being set up again for every URL.
+                session_id = f"{domain}-{n}"
+                run_config = self._run_config.clone(session_id=session_id)
+                try:
+                    while not queue.empty():
+                        index, nav_url = queue.get_nowait()
+                        try:
+                            results[index] = await self.crawl_page(nav_url, run_config)
+                        except Exception as e:
+                            results[index] = e
+                finally:
+                    try:
+                        await self.session.crawler_strategy.kill_session(session_id)
+                    except Exception:
+                        pass
+
+            workers = min(self.max_concurrent, len(nav_urls))
+            await asyncio.gather(*(worker(n) for n in range(workers)))
+
+            seen_urls = {page.url for page in pages}
             for result in results:
                 if isinstance(result, PageAnalysis) and result:
-                    if not any(p.url == result.url for p in pages):
+                    if result.url not in seen_urls:
+                        seen_urls.add(result.url)
                         pages.append(result)
 
         page_types = {}
@@ -503,11 +723,12 @@ class Crawl4AICrawler:
             global_visual = homepage_analysis.visual_features
 
         key_sections = []
+        seen_section_types = {"content", "footer"}
         for page in pages:
             for section in page.content_structure:
-                if section["type"] not in ["content", "footer"]:
-                    if not any(s["type"] == section["type"] for s in key_sections):
-                        key_sections.append(section)
+                if section["type"] not in seen_section_types:
+                    seen_section_types.add(section["type"])
+                    key_sections.append(section)
 
         return WebsiteAnalysis(
             base_url=base_url,
@@ -519,6 +740,17 @@ class Crawl4AICrawler:
         )
 
 
+def _dump_json(analysis: "WebsiteAnalysis", path: Path) -> None:
+    if orjson is not None:
+        # orjson serializes the nested dataclasses natively, no asdict() copy.
+        path.write_bytes(
+            orjson.dumps(analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(asdict(analysis), f, ensure_ascii=False, indent=2)
+
+
 async def main():
     """Main entry point for testing."""
     urls = [
@@ -537,8 +769,7 @@ async def main():
             )
             output_path.parent.mkdir(exist_ok=True)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(analysis), f, ensure_ascii=False, indent=2)
+            _dump_json(analysis, output_path)
 
             print(f"  Found {len(analysis.pages)} pages")
             print(f"  Page types: {list(analysis.navigation_structure.keys())}")
@@ -6,10 +6,13 @@ and generates page/section templates.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
+import os
 import re
-import hashlib
 import ssl
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -17,7 +20,218 @@ from typing import Optional
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag, UnicodeDammit
+
+# BeautifulSoup's "lxml" builder parses in C; html.parser is pure Python.
+try:
+    import lxml  # noqa: F401
+
+    BS4_PARSER = "lxml"
+except Exception:
+    BS4_PARSER = "html.parser"
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# RE2 matches in linear time and releases the GIL, which matters for scans
+# over the whole page HTML; fall back to `re` when it is not installed.
+try:
+    import re2 as _scan_re
+except Exception:
+    _scan_re = re
+
+# Only these tags (and their subtrees) are built into the soup: <body> keeps
+# the visible page, and the content tags are listed too for documents parsed
+# without a <body>. Scripts, styles and links in <head> are skipped; the
+# raw-HTML scans for styles and widgets read the response text instead.
+PAGE_STRAINER = SoupStrainer(
+    [
+        "title",
+        "meta",
+        "body",
+        "nav",
+        "main",
+        "section",
+        "article",
+        "aside",
+        "div",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "p",
+        "a",
+        "button",
+        "img",
+        "form",
+    ]
+)
+
+# Responses that are not HTML are skipped; bodies are cut to MAX_HTML_BYTES
+# before parsing so one huge page cannot blow up a worker's DOM.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+MAX_HTML_BYTES = 2_000_000
+
+_COLOR_VALUE_RE = _scan_re.compile(r"#[0-9a-fA-F]{3,8}|rgba?\([^)]+\)")
+_FONT_FAMILY_RE = _scan_re.compile(r"font-family:\s*([^;]+)")
+_MAX_WIDTH_RE = _scan_re.compile(r"max-width:\s*(\d+)px")
+_CLASS_PART_SPLIT_RE = re.compile(r"[\s_-]+")
+
+# Literal tokens looked for in the raw page HTML
+COLOR_PATTERNS = [
+    ("dark", ["bg-slate-900", "bg-gray-900", "bg-black", "dark"]),
+    ("light", ["bg-white", "bg-gray-50", "bg-slate-50"]),
+    ("blue", ["bg-blue-", "text-blue-"]),
+    ("green", ["bg-green-", "text-green-"]),
+    ("orange", ["bg-orange-", "text-orange-"]),
+    ("purple", ["bg-purple-", "text-purple-"]),
+]
+
+FONT_PATTERNS = {
+    "sans-serif": ["Inter", "Roboto", "Space Grotesk", "Oswald", "Helvetica"],
+    "serif": ["Cormorant Garamond", "Playfair", "Merriweather"],
+    "mono": ["Space Mono", "JetBrains Mono", "Fira Code"],
+}
+
+GRID_PATTERNS = [
+    "display: grid",
+    "grid-template",
+    "grid-cols-",
+    "grid-gap-",
+    "gap-x-",
+]
+
+FLEX_PATTERNS = [
+    "display: flex",
+    "justify-content",
+    "align-items",
+    "flex-wrap",
+    "flex-direction",
+]
+
+# Matched against the lower-cased HTML
+CHAT_PATTERNS = [
+    "intercom",
+    "crisp",
+    "tawk.to",
+    "livechat",
+    "drift",
+    "chatwoot",
+    "zendesk",
+    "hubspot",
+]
+
+ANALYTICS_PATTERNS = [
+    "google-analytics.com",
+    "gtag(",
+    "gtm.js",
+    "googletagmanager",
+    "hm.baidu.com",
+    "baidu.com/hm",
+]
+
+# CTA types by link text, in precedence order
+CTA_PATTERNS = {
+    "primary": ["buy", "purchase", "order", "shop"],
+    "secondary": ["demo", "trial", "try"],
+    "contact": ["contact", "get", "touch"],
+    "info": ["learn", "read", "more"],
+}
+
+# Section types by class/id token, in precedence order
+SECTION_CLASS_PATTERNS = [
+    ("hero", frozenset({"hero", "header", "banner"})),
+    ("features", frozenset({"features", "benefits"})),
+    ("pricing", frozenset({"pricing", "plans"})),
+    ("testimonials", frozenset({"testimonials", "reviews"})),
+    ("cta", frozenset({"cta", "call-to-action"})),
+    ("footer", frozenset({"footer"})),
+]
+SECTION_KEYWORDS = frozenset().union(*(kws for _, kws in SECTION_CLASS_PATTERNS))
+
+# Image types by lowercased class-name part, in precedence order
+IMAGE_CLASS_PATTERNS = [
+    ("logo", frozenset({"logo", "brand"})),
+    ("hero", frozenset({"hero", "banner", "header"})),
+    ("product", frozenset({"product", "device", "machine"})),
+    ("team", frozenset({"team", "people", "portrait"})),
+]
+
+_KEYWORDS = sorted(
+    {p for _, patterns in COLOR_PATTERNS for p in patterns}
+    | {f for fonts in FONT_PATTERNS.values() for f in fonts}
+    | set(GRID_PATTERNS)
+    | set(FLEX_PATTERNS)
+    | set(CHAT_PATTERNS)
+    | set(ANALYTICS_PATTERNS)
+    | {"sidebar"}
+)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+@functools.lru_cache(maxsize=8)
+def _keyword_hits(text: str) -> frozenset:
+    """Keywords from the pattern tables that occur in `text` (case-sensitive).
+
+    One Aho-Corasick pass replaces a substring scan per keyword; the cache
+    lets every analyzer share the scan of the same page HTML.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return frozenset(kw for kw in _KEYWORDS if kw in text)
+    return frozenset(kw for _, kw in _KEYWORD_AUTOMATON.iter(text))
+
+
+def _group_regex(groups: dict) -> re.Pattern:
+    """Compile `{name: [literals]}` into one alternation of named groups.
+
+    A single finditer then reports, via `match.lastgroup`, every group with a
+    literal in the text. The alternation sits in a lookahead so overlapping
+    literals are all seen; where several start at the same position the
+    earliest group wins. Empty literals are skipped.
+    """
+    alternation = []
+    for name, literals in groups.items():
+        alternatives = sorted((re.escape(lit) for lit in literals if lit), key=len)
+        alternation.append(f"(?P<{name}>{'|'.join(reversed(alternatives))})")
+    return re.compile(f"(?=(?:{'|'.join(alternation)}))")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_url(url: str, base_url: str, base_netloc: str) -> Optional[str]:
+    """Resolve `url` against `base_url`; None if off-site or not a page link.
+
+    Cached because the same nav/footer hrefs recur on every page of a site.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if url.startswith("javascript:") or url.startswith("mailto:"):
+        return None
+    if url.startswith("//"):
+        url = "https:" + url
+    elif not url.startswith("http"):
+        url = urljoin(base_url, url)
+    if urlparse(url).netloc != base_netloc:
+        return None
+    return url
+
+
+_CTA_TYPE_RE = _group_regex(CTA_PATTERNS)
+_CTA_TYPE_RANK = {cta_type: rank for rank, cta_type in enumerate(CTA_PATTERNS)}
 
 
 # Create unverified SSL context for local crawling
@@ -26,7 +240,58 @@ SSL_CONTEXT.check_hostname = False
 SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 
 
-@dataclass
+class AdaptiveSemaphore:
+    """Semaphore whose permit count follows an AIMD target.
+
+    Successful responses grow the target by one permit per window (additive
+    increase); a timeout, 429 or 5xx halves it (multiplicative decrease),
+    never below `min_target` nor above `max_target`.
+    """
+
+    def __init__(self, target: int, max_target: int, min_target: int = 1):
+        self.min_target = min_target
+        self.max_target = max(max_target, target)
+        self.target = max(target, min_target)
+        self._window = float(self.target)
+        self._sem = asyncio.Semaphore(self.target)
+        # Permits to retire after a shrink, taken as they come free.
+        self._excess = 0
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        while self._excess:
+            self._excess -= 1
+            await self._sem.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._excess:
+            self._excess -= 1
+        else:
+            self._sem.release()
+
+    def set_target(self, n: int) -> None:
+        """Add or retire permits so at most `n` holders run at once."""
+        n = min(max(n, self.min_target), self.max_target)
+        delta, self.target = n - self.target, n
+        if delta < 0:
+            self._excess -= delta
+            return
+        paid = min(delta, self._excess)
+        self._excess -= paid
+        for _ in range(delta - paid):
+            self._sem.release()
+
+    def record_success(self) -> None:
+        self._window = min(self._window + 1 / self.target, self.max_target)
+        self.set_target(int(self._window))
+
+    def record_failure(self) -> None:
+        self._window = max(self._window / 2, self.min_target)
+        self.set_target(int(self._window))
+
+
+@dataclass(slots=True)
 class PageAnalysis:
     """Analysis result for a single page."""
 
@@ -48,13 +313,13 @@ class PageAnalysis:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class WebsiteAnalysis:
     """Complete analysis for a website."""
 
     base_url: str
     domain: str
-    pages: list = field(default_factory=list)
+    pages: list = field(default_factory=list)  # [PageAnalysis]
     navigation_structure: dict = field(default_factory=dict)
     global_visual_features: dict = field(default_factory=dict)
     key_sections: list = field(default_factory=list)
@@ -84,15 +349,54 @@ class WebsiteCrawler:
         "blog": ["blog", "news", "updates", "journal", "insights"],
     }
 
-    def __init__(self, max_concurrent: int = 3, timeout: int = 30):
+    # The empty "home" pattern stands for the site root and is checked
+    # separately. Navigation labels are too generic to signal home, contact
+    # or blog pages.
+    PAGE_TYPE_RE = _group_regex(PAGE_TYPE_PATTERNS)
+    NAV_PAGE_TYPE_RE = _group_regex(
+        {
+            page_type: patterns
+            for page_type, patterns in PAGE_TYPE_PATTERNS.items()
+            if page_type not in ("home", "contact", "blog")
+        }
+    )
+    _PAGE_TYPE_RANK = {
+        page_type: rank for rank, page_type in enumerate(PAGE_TYPE_PATTERNS)
+    }
+
+    def __init__(
+        self,
+        max_concurrent: int = 3,
+        timeout: int = 30,
+        max_fetch_concurrent: int = 30,
+        max_host_concurrent: int = 12,
+        cache_dir: Optional[str | Path] = None,
+    ):
+        # Requests per host start at max_concurrent and adapt (AIMD) up to
+        # max_host_concurrent; max_fetch_concurrent caps in-flight requests
+        # overall. Parsing is bounded by the process pool. With a cache_dir
+        # (e.g. PAGE_CACHE_DIR), parsed pages are cached there by URL and
+        # body hash; the default None disables the cache.
         self.max_concurrent = max_concurrent
+        self.max_host_concurrent = max_host_concurrent
         self.timeout = timeout
         self.session: Optional[aiohttp.ClientSession] = None
         self.visited_urls: set = set()
+        self.fetch_semaphore = asyncio.Semaphore(max_fetch_concurrent)
+        self._host_limits: dict[str, AdaptiveSemaphore] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=self.timeout)
-        connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
+        # Keep connections and DNS answers around between pages: a crawl hits
+        # the same origin over and over, so TLS and DNS setup amortize.
+        connector = aiohttp.TCPConnector(
+            ssl=SSL_CONTEXT,
+            limit=100,
+            limit_per_host=self.max_host_concurrent,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
         self.session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
@@ -100,51 +404,45 @@ class WebsiteCrawler:
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             },
         )
+        self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
-    def normalize_url(self, url: str, base_url: str) -> Optional[str]:
+    def normalize_url(
+        self, url: str, base_url: str, base_netloc: Optional[str] = None
+    ) -> Optional[str]:
         """Normalize and validate URL."""
-        if not url:
-            return None
-        url = url.strip()
-        if url.startswith("javascript:") or url.startswith("mailto:"):
-            return None
-        if url.startswith("//"):
-            url = "https:" + url
-        elif not url.startswith("http"):
-            url = urljoin(base_url, url)
-        parsed = urlparse(url)
-        if parsed.netloc != urlparse(base_url).netloc:
-            return None
-        return url
+        if base_netloc is None:
+            base_netloc = urlparse(base_url).netloc
+        return _normalize_url(url, base_url, base_netloc)
 
     def classify_page_type(self, url: str, title: str, nav_links: list) -> str:
         """Classify page type based on URL, title, and navigation."""
-        url_lower = url.lower()
-        title_lower = title.lower()
+        rank = self._PAGE_TYPE_RANK.__getitem__
 
         # Check URL patterns
-        for page_type, patterns in self.PAGE_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower or pattern in title_lower:
-                    return page_type
+        page_types = {m.lastgroup for m in self.PAGE_TYPE_RE.finditer(url.lower())}
+        page_types.update(
+            m.lastgroup for m in self.PAGE_TYPE_RE.finditer(title.lower())
+        )
+        if not urlparse(url).path.strip("/"):
+            page_types.add("home")
+        if page_types:
+            return min(page_types, key=rank)
 
         # Check navigation context
         nav_texts = " ".join([link.get("text", "").lower() for link in nav_links])
-        for page_type, patterns in self.PAGE_TYPE_PATTERNS.items():
-            if page_type in ["home", "contact", "blog"]:
-                continue
-            for pattern in patterns:
-                if pattern in nav_texts:
-                    return page_type
+        page_types = {m.lastgroup for m in self.NAV_PAGE_TYPE_RE.finditer(nav_texts)}
+        if page_types:
+            return min(page_types, key=rank)
 
         return "landing"  # Default for home/main landing pages
 
-    def extract_colors(self, soup: BeautifulSoup) -> dict:
+    def extract_colors(self, soup: BeautifulSoup, html: str) -> dict:
         """Extract color-related visual features."""
         colors = {
             "background": None,
@@ -160,32 +458,22 @@ class WebsiteCrawler:
             style = body.get("style", "")
             colors["background"] = self._extract_color(style)
 
-        # Check for common color classes - convert soup to string once
-        html = str(soup)
-
-        color_patterns = [
-            ("dark", ["bg-slate-900", "bg-gray-900", "bg-black", "dark"]),
-            ("light", ["bg-white", "bg-gray-50", "bg-slate-50"]),
-            ("blue", ["bg-blue-", "text-blue-"]),
-            ("green", ["bg-green-", "text-green-"]),
-            ("orange", ["bg-orange-", "text-orange-"]),
-            ("purple", ["bg-purple-", "text-purple-"]),
-        ]
-
-        for color_name, patterns in color_patterns:
-            for pattern in patterns:
-                if pattern in html:
-                    colors["accent"] = color_name
-                    break
+        # Check for common color classes in the raw page HTML; the last group
+        # with a hit wins.
+        hits = _keyword_hits(html)
+        for color_name, patterns in reversed(COLOR_PATTERNS):
+            if hits.intersection(patterns):
+                colors["accent"] = color_name
+                break
 
         return colors
 
     def _extract_color(self, style: str) -> Optional[str]:
         """Extract color from style string."""
-        color_match = re.search(r"#[0-9a-fA-F]{3,8}|rgba?\([^)]+\)", style)
+        color_match = _COLOR_VALUE_RE.search(style)
         return color_match.group(0) if color_match else None
 
-    def extract_fonts(self, soup: BeautifulSoup) -> dict:
+    def extract_fonts(self, html: str) -> dict:
         """Extract font-related features."""
         fonts = {
             "heading_font": None,
@@ -193,24 +481,18 @@ class WebsiteCrawler:
             "font_weights": [],
         }
 
-        # Check for font-family in styles
-        html = str(soup)
-        font_families = re.findall(r"font-family:\s*([^;]+)", html)
-        if font_families:
-            fonts["heading_font"] = font_families[0].strip().strip("'\"")
-
-        # Check common font patterns
-        font_patterns = {
-            "sans-serif": ["Inter", "Roboto", "Space Grotesk", "Oswald", "Helvetica"],
-            "serif": ["Cormorant Garamond", "Playfair", "Merriweather"],
-            "mono": ["Space Mono", "JetBrains Mono", "Fira Code"],
-        }
+        # Check common font patterns; the last group with a hit wins
+        hits = _keyword_hits(html)
+        for fonts_list in reversed(FONT_PATTERNS.values()):
+            font = next((f for f in fonts_list if f in hits), None)
+            if font:
+                fonts["heading_font"] = font
+                return fonts
 
-        for font_type, fonts_list in font_patterns.items():
-            for font in fonts_list:
-                if font in html:
-                    fonts["heading_font"] = font
-                    break
+        # Otherwise fall back to the first font-family in styles
+        font_family = _FONT_FAMILY_RE.search(html)
+        if font_family:
+            fonts["heading_font"] = font_family.group(1).strip().strip("'\"")
 
         return fonts
 
@@ -221,23 +503,19 @@ class WebsiteCrawler:
         # Look for semantic sections
         section_tags = ["section", "article", "main", "div"]
         for tag in soup.find_all(section_tags):
-            classes = tag.get("class", [])
-            tag_id = tag.get("id", "")
+            names = " ".join(tag.get("class", []) + [tag.get("id", "")])
+            tokens = set(_CLASS_PART_SPLIT_RE.split(names.lower()))
+
+            # Plain <div>s are mostly layout wrappers; only keep the ones
+            # whose class or id names a known section.
+            if tag.name == "div" and not tokens & SECTION_KEYWORDS:
+                continue
 
             # Identify section type
-            section_type = "content"
-            if any(c in classes or tag_id for c in ["hero", "header", "banner"]):
-                section_type = "hero"
-            elif any(c in classes or tag_id for c in ["features", "benefits"]):
-                section_type = "features"
-            elif any(c in classes or tag_id for c in ["pricing", "plans"]):
-                section_type = "pricing"
-            elif any(c in classes or tag_id for c in ["testimonials", "reviews"]):
-                section_type = "testimonials"
-            elif any(c in classes or tag_id for c in ["cta", "call-to-action"]):
-                section_type = "cta"
-            elif any(c in classes or tag_id for c in ["footer"]):
-                section_type = "footer"
+            section_type = next(
+                (name for name, kws in SECTION_CLASS_PATTERNS if tokens & kws),
+                "content",
+            )
 
             # Extract section content
             h = tag.find(["h1", "h2", "h3"])
@@ -260,135 +538,167 @@ class WebsiteCrawler:
             return None
         self.visited_urls.add(url)
 
-        try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    return None
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Extract basic info
-                title = soup.title.string if soup.title else ""
-                meta_desc = soup.find("meta", {"name": "description"})
-                description = meta_desc.get("content", "") if meta_desc else ""
-                h1 = soup.find("h1")
-                h1_text = h1.get_text(strip=True) if h1 else ""
-
-                # Extract headings
-                headings = {"h1": [], "h2": [], "h3": [], "h4": []}
-                for level in headings:
-                    for h in soup.find_all(level):
-                        text = h.get_text(strip=True)
-                        if text:
-                            headings[level].append(text)
-
-                # Extract paragraphs
-                paragraphs = [
-                    p.get_text(strip=True)
-                    for p in soup.find_all("p")
-                    if p.get_text(strip=True)
-                ]
-
-                # Extract CTAs
-                ctas = []
-                for a in soup.find_all("a", href=True):
-                    text = a.get_text(strip=True)
-                    if text and len(text) < 100:
-                        ctas.append(
-                            {
-                                "text": text,
-                                "url": a["href"],
-                                "type": self._classify_cta(text),
-                            }
-                        )
-
-                # Extract navigation links
-                nav_links = []
-                for nav in soup.find_all("nav"):
-                    for a in nav.find_all("a", href=True):
-                        href = self.normalize_url(a["href"], url)
-                        if href:
-                            nav_links.append(
-                                {"text": a.get_text(strip=True)[:50], "url": href}
-                            )
-
-                # Extract images
-                images = []
-                for img in soup.find_all("img", src=True):
-                    src = img.get("src", "")
-                    if src:
-                        images.append(
-                            {
-                                "src": src,
-                                "alt": img.get("alt", "")[:100],
-                                "type": self._classify_image(img.get("class", [])),
-                            }
-                        )
-
-                # Extract forms and widgets
-                form_count = len(soup.find_all("form"))
-                html_lower = html.lower()
-                chat_patterns = [
-                    "intercom",
-                    "crisp",
-                    "tawk.to",
-                    "livechat",
-                    "drift",
-                    "chatwoot",
-                    "zendesk",
-                    "hubspot",
-                ]
-                has_chat_widget = any(
-                    pattern in html_lower for pattern in chat_patterns
-                )
-                analytics_patterns = [
-                    "google-analytics.com",
-                    "gtag(",
-                    "gtm.js",
-                    "googletagmanager",
-                    "hm.baidu.com",
-                    "baidu.com/hm",
-                ]
-                has_analytics = any(
-                    pattern in html_lower for pattern in analytics_patterns
-                )
-
-                # Extract visual features
-                visual_features = {
-                    "colors": self.extract_colors(soup),
-                    "fonts": self.extract_fonts(soup),
-                    "layout_patterns": self._detect_layout_patterns(soup),
-                }
+        host = urlparse(url).netloc
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = AdaptiveSemaphore(
+                self.max_concurrent, self.max_host_concurrent
+            )
 
-                # Analyze structure
-                content_structure = self.analyze_structure(soup)
-
-                # Classify page type
-                page_type = self.classify_page_type(url, title, nav_links)
-
-                return PageAnalysis(
-                    url=url,
-                    page_type=page_type,
-                    title=title,
-                    description=description,
-                    h1=h1_text,
-                    headings=headings,
-                    paragraphs=paragraphs[:20],
-                    ctas=ctas[:10],
-                    links=nav_links[:20],
-                    images=images[:10],
-                    form_count=form_count,
-                    has_chat_widget=has_chat_widget,
-                    has_analytics=has_analytics,
-                    visual_features=visual_features,
-                    content_structure=content_structure,
-                )
+        try:
+            # Only the download holds fetch slots; they are released before
+            # the page is handed to the parser pool.
+            async with host_limit, self.fetch_semaphore:
+                async with self.session.get(url) as response:
+                    if response.status == 429 or response.status >= 500:
+                        host_limit.record_failure()
+                        return None
+                    if response.status != 200:
+                        return None
+                    host_limit.record_success()
+                    if (
+                        "Content-Type" in response.headers
+                        and response.content_type not in HTML_CONTENT_TYPES
+                    ):
+                        return None
+
+                    # Raw bytes: decoding happens in the parser pool, without
+                    # aiohttp's charset sniffing.
+                    raw = await _read_html(response, url)
+                    charset = response.charset
+                    no_store = "no-store" in response.headers.get(
+                        "Cache-Control", ""
+                    )
+
+            # Parsing is CPU-bound: hand it to the process pool so the event
+            # loop keeps other fetches moving while this page is analyzed.
+            loop = asyncio.get_running_loop()
+            cache_dir = None if no_store else self.cache_dir
+            return await loop.run_in_executor(
+                self._pool, _parse_page, raw, charset, url, cache_dir
+            )
 
+        except asyncio.TimeoutError:
+            host_limit.record_failure()
+            print(f"Error crawling {url}: timed out")
+            return None
         except Exception as e:
             print(f"Error crawling {url}: {e}")
             return None
 
+    def analyze_html(self, url: str, html: str) -> PageAnalysis:
+        """Analyze a fetched page's HTML (pure CPU work, no I/O)."""
+        soup = BeautifulSoup(html, BS4_PARSER, parse_only=PAGE_STRAINER)
+
+        # Extract basic info, headings, paragraphs, CTAs, navigation links,
+        # images and forms in one walk of the tree instead of a find_all()
+        # traversal per element type. Each node carries whether it sits
+        # inside a <nav>; the capped lists stop collecting once full (nav
+        # links stay uncapped, page-type classification reads all of them).
+        # get_text() returns a plain str; .string is a NavigableString tied to
+        # the whole tree, which cannot be pickled back from a parse worker.
+        title = soup.title.get_text() if soup.title else ""
+        description = ""
+        h1_text = None
+        headings = {"h1": [], "h2": [], "h3": [], "h4": []}
+        paragraphs = []
+        ctas = []
+        nav_links = []
+        images = []
+        form_count = 0
+        meta_seen = False
+        base_netloc = urlparse(url).netloc
+
+        stack = [(soup, False)]
+        while stack:
+            node, in_nav = stack.pop()
+            for tag in reversed(node.contents):
+                if isinstance(tag, Tag):
+                    stack.append((tag, in_nav or tag.name == "nav"))
+            name = node.name
+            if name in headings:
+                text = node.get_text(strip=True)
+                if h1_text is None and name == "h1":
+                    h1_text = text
+                if text:
+                    headings[name].append(text)
+            elif name == "p":
+                if len(paragraphs) < 20:
+                    text = node.get_text(strip=True)
+                    if text:
+                        paragraphs.append(text)
+            elif name == "a":
+                href = node.get("href")
+                if href is None or not (in_nav or len(ctas) < 10):
+                    continue
+                text = node.get_text(strip=True)
+                if len(ctas) < 10 and text and len(text) < 100:
+                    ctas.append(
+                        {
+                            "text": text,
+                            "url": href,
+                            "type": self._classify_cta(text),
+                        }
+                    )
+                if in_nav:
+                    nav_href = self.normalize_url(href, url, base_netloc)
+                    if nav_href:
+                        nav_links.append({"text": text[:50], "url": nav_href})
+            elif name == "img":
+                src = node.get("src")
+                if src and len(images) < 10:
+                    images.append(
+                        {
+                            "src": src,
+                            "alt": node.get("alt", "")[:100],
+                            "type": self._classify_image(node.get("class", [])),
+                        }
+                    )
+            elif name == "form":
+                form_count += 1
+            elif name == "meta" and not meta_seen:
+                if node.get("name") == "description":
+                    meta_seen = True
+                    description = node.get("content", "")
+        if h1_text is None:
+            h1_text = ""
+
+        # Detect widgets
+        lower_hits = _keyword_hits(html.lower())
+        has_chat_widget = any(p in lower_hits for p in CHAT_PATTERNS)
+        has_analytics = any(p in lower_hits for p in ANALYTICS_PATTERNS)
+
+        # Extract visual features
+        visual_features = {
+            "colors": self.extract_colors(soup, html),
+            "fonts": self.extract_fonts(html),
+            "layout_patterns": self._detect_layout_patterns(soup, html),
+        }
+
+        # Analyze structure
+        content_structure = self.analyze_structure(soup)
+
+        # Classify page type
+        page_type = self.classify_page_type(url, title, nav_links)
+
+        return PageAnalysis(
+            url=url,
+            page_type=page_type,
+            title=title,
+            description=description,
+            h1=h1_text,
+            headings=headings,
+            paragraphs=paragraphs,
+            ctas=ctas,
+            links=nav_links[:20],
+            images=images,
+            form_count=form_count,
+            has_chat_widget=has_chat_widget,
+            has_analytics=has_analytics,
+            visual_features=visual_features,
+            content_structure=content_structure,
+        )
+
     def to_dict(self, analysis: PageAnalysis) -> dict:
         """Convert PageAnalysis to dict for JSON serialization."""
         return {
@@ -412,31 +722,21 @@ class WebsiteCrawler:
 
     def _classify_cta(self, text: str) -> str:
         """Classify CTA type based on text."""
-        text_lower = text.lower()
-        if any(w in text_lower for w in ["buy", "purchase", "order", "shop"]):
-            return "primary"
-        if any(w in text_lower for w in ["demo", "trial", "try"]):
-            return "secondary"
-        if any(w in text_lower for w in ["contact", "get", "touch"]):
-            return "contact"
-        if any(w in text_lower for w in ["learn", "read", "more"]):
-            return "info"
+        cta_types = {m.lastgroup for m in _CTA_TYPE_RE.finditer(text.lower())}
+        if cta_types:
+            return min(cta_types, key=_CTA_TYPE_RANK.__getitem__)
         return "general"
 
     def _classify_image(self, classes: list) -> str:
         """Classify image type based on classes."""
-        classes_str = " ".join(classes).lower()
-        if any(c in classes_str for c in ["logo", "brand"]):
-            return "logo"
-        if any(c in classes_str for c in ["hero", "banner", "header"]):
-            return "hero"
-        if any(c in classes_str for c in ["product", "device", "machine"]):
-            return "product"
-        if any(c in classes_str for c in ["team", "people", "portrait"]):
-            return "team"
-        return "general"
+        # Split BEM/utility names ("site-logo", "hero__img") into parts so a
+        # keyword matches by hash lookup instead of a substring scan.
+        tokens = set(_CLASS_PART_SPLIT_RE.split(" ".join(classes).lower()))
+        return next(
+            (name for name, kws in IMAGE_CLASS_PATTERNS if tokens & kws), "general"
+        )
 
-    def _detect_layout_patterns(self, soup: BeautifulSoup) -> dict:
+    def _detect_layout_patterns(self, soup: BeautifulSoup, html: str) -> dict:
         """Detect layout patterns from page structure."""
         patterns = {
             "has_grid": False,
@@ -446,39 +746,25 @@ class WebsiteCrawler:
             "section_count": 0,
         }
 
-        html = str(soup)
+        hits = _keyword_hits(html)
 
         # Check for CSS Grid patterns in HTML and classes
-        grid_patterns = [
-            "display: grid",
-            "grid-template",
-            "grid-cols-",
-            "grid-gap-",
-            "gap-x-",
-        ]
-        if any(p in html for p in grid_patterns):
+        if any(p in hits for p in GRID_PATTERNS):
             patterns["has_grid"] = True
 
         # Check for Flexbox patterns
-        flex_patterns = [
-            "display: flex",
-            "justify-content",
-            "align-items",
-            "flex-wrap",
-            "flex-direction",
-        ]
-        if any(p in html for p in flex_patterns):
+        if any(p in hits for p in FLEX_PATTERNS):
             patterns["has_flex"] = True
 
         # Check for sidebar
-        if soup.find(["aside", "sidebar"]) or "sidebar" in html:
+        if "sidebar" in hits or soup.find(["aside", "sidebar"]):
             patterns["has_sidebar"] = True
 
         # Count sections
         patterns["section_count"] = len(soup.find_all("section"))
 
         # Extract max-width
-        max_width_match = re.search(r"max-width:\s*(\d+)px", html)
+        max_width_match = _MAX_WIDTH_RE.search(html)
         if max_width_match:
             patterns["max_width"] = int(max_width_match.group(1))
 
@@ -504,21 +790,23 @@ class WebsiteCrawler:
         # Discover navigation links
         if homepage_analysis and homepage_analysis.links:
             nav_urls = [link["url"] for link in homepage_analysis.links[:15]]
-
-            # Crawl key pages discovered from navigation
-            semaphore = asyncio.Semaphore(self.max_concurrent)
-
-            async def crawl_with_limit(url):
-                async with semaphore:
-                    return await self.crawl_page(url)
-
-            tasks = [crawl_with_limit(url) for url in nav_urls]
+            # Menus often repeat links (header + mobile menu); schedule each
+            # unvisited URL once.
+            nav_urls = [
+                url for url in dict.fromkeys(nav_urls) if url not in self.visited_urls
+            ]
+
+            # Crawl key pages discovered from navigation; crawl_page bounds
+            # fetch and parse concurrency separately.
+            tasks = [self.crawl_page(url) for url in nav_urls]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
+            seen_urls = {page.url for page in pages}
             for result in results:
                 if isinstance(result, PageAnalysis) and result:
                     # Avoid duplicates
-                    if not any(p.url == result.url for p in pages):
+                    if result.url not in seen_urls:
+                        seen_urls.add(result.url)
                         pages.append(result)
 
         # Classify pages and identify key sections
@@ -535,22 +823,127 @@ class WebsiteCrawler:
 
         # Identify key sections across all pages
         key_sections = []
+        seen_section_types = {"content", "footer"}
         for page in pages:
             for section in page.content_structure:
-                if section["type"] not in ["content", "footer"]:
-                    if not any(s["type"] == section["type"] for s in key_sections):
-                        key_sections.append(section)
+                if section["type"] not in seen_section_types:
+                    seen_section_types.add(section["type"])
+                    key_sections.append(section)
 
         return WebsiteAnalysis(
             base_url=base_url,
             domain=domain,
-            pages=[asdict(p) for p in pages],
+            pages=pages,
             navigation_structure=page_types,
             global_visual_features=global_visual,
             key_sections=key_sections,
         )
 
 
+async def _read_html(response: aiohttp.ClientResponse, url: str) -> bytes:
+    """Read the body, stopping after MAX_HTML_BYTES (the rest is dropped)."""
+    raw = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        raw += chunk
+        if len(raw) > MAX_HTML_BYTES:
+            print(f"Warning: {url} is larger than {MAX_HTML_BYTES} bytes, truncated")
+            del raw[MAX_HTML_BYTES:]
+            break
+    return bytes(raw)
+
+
+def _decode_html(raw: bytes, charset: Optional[str]) -> str:
+    """Decode a response body with its declared charset, else as UTF-8.
+
+    Bodies that are not valid UTF-8 fall back to BeautifulSoup's detector,
+    which also honours <meta charset> declarations.
+    """
+    if charset:
+        try:
+            return raw.decode(charset, "replace")
+        except LookupError:
+            pass
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.reason == "unexpected end of data":
+            # A body truncated at MAX_HTML_BYTES mid-character.
+            return raw[: e.start].decode("utf-8")
+        html = UnicodeDammit(raw, is_html=True).unicode_markup
+        return html if html is not None else raw.decode("utf-8", "replace")
+
+
+# Part of every page cache key: bump it whenever analyze_html() output changes
+# so entries written by an older analyzer are never served.
+PAGE_CACHE_VERSION = 1
+
+# Opt-in page cache location, anchored to the repo root (see .gitignore)
+# rather than the working directory.
+PAGE_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "crawler"
+
+
+def _page_cache_path(cache_dir: Path, *parts: bytes) -> Path:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(PAGE_CACHE_VERSION.to_bytes(4, "little"))
+    for part in parts:
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    key = digest.hexdigest()
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def _parse_page(
+    raw: bytes, charset: Optional[str], url: str, cache_dir: Optional[Path] = None
+) -> PageAnalysis:
+    """Process-pool entry point: decode and analyze one page in a worker.
+
+    With a `cache_dir`, a page whose URL and body were analyzed before is
+    loaded from disk instead of parsed again.
+    """
+    if cache_dir is None:
+        return WebsiteCrawler().analyze_html(url, _decode_html(raw, charset))
+
+    path = _page_cache_path(
+        cache_dir, url.encode("utf-8"), (charset or "").encode("ascii", "replace"), raw
+    )
+    try:
+        data = path.read_bytes()
+        fields = orjson.loads(data) if orjson is not None else json.loads(data)
+        # A hit is a fresh analysis of identical input: stamp it now.
+        fields.pop("created_at", None)
+        return PageAnalysis(**fields)
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Missing, truncated or stale entry: parse and rewrite it.
+        pass
+
+    analysis = WebsiteCrawler().analyze_html(url, _decode_html(raw, charset))
+    if orjson is not None:
+        data = orjson.dumps(analysis)
+    else:
+        data = json.dumps(asdict(analysis), ensure_ascii=False).encode("utf-8")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent workers never see a partial file.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return analysis
+
+
+def _dump_json(analysis: WebsiteAnalysis, path: Path) -> None:
+    if orjson is not None:
+        # orjson serializes the nested dataclasses natively, no asdict() copy.
+        path.write_bytes(
+            orjson.dumps(analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(asdict(analysis), f, ensure_ascii=False, indent=2)
+
+
 async def main():
     """Main entry point for testing."""
     urls = [
@@ -561,21 +954,23 @@ async def main():
         "anduril.com",
     ]
 
-    async with WebsiteCrawler() as crawler:
-        for url in urls:
-            print(f"\nCrawling {url}...")
-            analysis = await crawler.crawl_website(url)
+    output_dir = Path("/Users/beihuang/Documents/opencode/shpitto/output/crawled")
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-            output_path = Path(
-                f"/Users/beihuang/Documents/opencode/shpitto/output/crawled/{analysis.domain}.json"
-            )
-            output_path.parent.mkdir(exist_ok=True)
+    async def crawl_and_write(crawler: WebsiteCrawler, url: str) -> None:
+        print(f"\nCrawling {url}...")
+        analysis = await crawler.crawl_website(url)
+        output_path = output_dir / f"{analysis.domain}.json"
+        # Serializing and writing stay off the loop the other crawls share.
+        await asyncio.to_thread(_dump_json, analysis, output_path)
 
-            with output_path.open("w", encoding="utf-8") as f:
-                json.dump(asdict(analysis), f, ensure_ascii=False, indent=2)
+        print(f"  {analysis.domain}: found {len(analysis.pages)} pages")
+        print(f"  {analysis.domain}: page types {list(analysis.navigation_structure)}")
 
-            print(f"  Found {len(analysis.pages)} pages")
-            print(f"  Page types: {list(analysis.navigation_structure.keys())}")
+    # Sites are crawled concurrently; per-host and global fetch limits still
+    # apply inside the shared crawler.
+    async with WebsiteCrawler(cache_dir=PAGE_CACHE_DIR) as crawler:
+        await asyncio.gather(*(crawl_and_write(crawler, url) for url in urls))
 
 
 if __name__ == "__main__":
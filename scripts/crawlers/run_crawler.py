@@ -10,6 +10,7 @@ Usage:
 """
 
 import asyncio
+import functools
 import json
 import argparse
 from pathlib import Path
@@ -72,6 +73,31 @@ async def crawl_single_website_crawl4ai(url: str, crawler) -> dict:
         return {"base_url": url, "domain": url.split("/")[0], "error": str(e)}
 
 
+async def crawl_pool(urls: list, max_concurrent: int, crawl) -> list:
+    """Run `crawl(url)` for every URL on a fixed pool of workers.
+
+    Each worker takes the next URL as soon as its current site finishes, so a
+    slow site never holds up the others and only `max_concurrent` tasks exist
+    however long the URL list is. Results (or exceptions) keep input order.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        queue.put_nowait((index, url))
+    results: list = [None] * len(urls)
+
+    async def worker():
+        while not queue.empty():
+            index, url = queue.get_nowait()
+            try:
+                results[index] = await crawl(url)
+            except Exception as e:
+                results[index] = e
+
+    workers = min(max(1, max_concurrent), len(urls))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
 async def run_crawl4ai_all(urls: list, max_concurrent: int = 3):
     """Crawl all websites using Crawl4AI."""
     print(f"\nCrawling {len(urls)} websites using Crawl4AI...")
@@ -82,14 +108,8 @@ async def run_crawl4ai_all(urls: list, max_concurrent: int = 3):
     from crawl4ai_crawler import Crawl4AICrawler
 
     async with Crawl4AICrawler(max_concurrent=max_concurrent) as crawler:
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def crawl_with_semaphore(url):
-            async with semaphore:
-                return await crawl_single_website_crawl4ai(url, crawler)
-
-        tasks = [crawl_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        crawl = functools.partial(crawl_single_website_crawl4ai, crawler=crawler)
+        results = await crawl_pool(urls, max_concurrent, crawl)
 
         for result in results:
             if isinstance(result, dict):
@@ -185,14 +205,7 @@ Examples:
                 from crawler import crawl_single_website as legacy_crawl
 
                 print(f"\nUsing legacy aiohttp crawler...")
-                semaphore = asyncio.Semaphore(max_concurrent)
-
-                async def crawl_with_semaphore(url):
-                    async with semaphore:
-                        return await legacy_crawl(url)
-
-                tasks = [crawl_with_semaphore(url) for url in urls]
-                return await asyncio.gather(*tasks, return_exceptions=True)
+                return await crawl_pool(urls, max_concurrent, legacy_crawl)
 
             await run_legacy_all(urls, args.max_concurrent)
         else:
@@ -11,6 +11,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+_SLUG_DROP_RE = re.compile(r"[^a-z0-9\s-]+")
+_SLUG_SEP_RE = re.compile(r"[\s-]+")
+
 
 @dataclass
 class GeneratedPageTemplate:
@@ -82,10 +85,8 @@ class TemplateGenerator:
         """Convert text to URL-friendly slug."""
         if not text:
             return "untitled"
-        text = text.lower()
-        text = re.sub(r"[^a-z0-9\s-]", "", text)
-        text = re.sub(r"[\s-]+", "-", text)
-        return text.strip("-")
+        text = _SLUG_DROP_RE.sub("", text.lower())
+        return _SLUG_SEP_RE.sub("-", text).strip("-")
 
     def extract_palette_from_analysis(self, visual_features: dict) -> dict:
         """Extract color palette from visual analysis."""
@@ -20,6 +20,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from lib.llm import (
+    LLMCache,
     OpenRouterClient,
     BatchTemplateProcessor,
     run_batch_generation,
@@ -107,6 +108,22 @@ Examples:
         default="output/ai-templates",
         help="Output directory (default: output/ai-templates)",
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Use the Anthropic Message Batches API (anthropic/* models, needs ANTHROPIC_API_KEY)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Cap OpenRouter requests per minute (default: unlimited)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM responses in .cache/llm",
+    )
     parser.add_argument(
         "--import",
         action="store_true",
@@ -146,7 +163,8 @@ Examples:
             print(f"❌ Snapshot not found: {args.single}")
             return 1
 
-        client = OpenRouterClient(model=args.model)
+        cache = None if args.no_cache else LLMCache(".cache/llm")
+        client = OpenRouterClient(model=args.model, cache=cache)
         processor = BatchTemplateProcessor(client, args.output)
         result = processor.process_site(
             screenshot_path=target["screenshot"],
@@ -168,6 +186,9 @@ Examples:
             output_dir=args.output,
             model=args.model,
             limit=args.limit,
+            use_batch_api=args.batch_api,
+            cache_dir=None if args.no_cache else ".cache/llm",
+            requests_per_minute=args.rpm,
         )
 
         print(f"\n✅ Complete!")